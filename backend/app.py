@@ -1,36 +1,70 @@
+# backend/app.py
+# Application factory. Nothing here runs at import time: gunicorn loads
+# backend.wsgi:app, the flask CLI calls create_app() itself, and the legacy
+# `backend.app:app` attribute is built on first access (see __getattr__ below).
+# Extension and blueprint imports live inside create_app() so that importing
+# this module stays cheap for CLI commands and tooling.
+
 from flask import Flask
-from flask_cors import CORS
-from flask_jwt_extended import JWTManager
-from backend.extensions import db, migrate, bcrypt
-from backend.config import Config
 import logging
 import os
 
-def create_app():
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), '..', 'migrations')
+SQLITE_PATH = os.path.join(os.path.dirname(__file__), '..', 'site.db')
+
+def resolve_database_uri(uri):
+    # SQLite always points at the repo-level site.db, whatever the relative path
+    if uri.startswith('sqlite'):
+        return f"sqlite:///{SQLITE_PATH}"
+    return uri
+
+def create_app(with_migrations=True, test_config=None):
+    # Load .env before backend.config reads the environment
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    from flask_cors import CORS
+    from flask_jwt_extended import JWTManager
+    from backend.extensions import db, bcrypt, compress, limiter, request_cache
+    from backend.config import Config
+
     app = Flask(__name__)
     app.config.from_object(Config)
     
     # Configure database path for migrations
-    if app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
-        app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(os.path.dirname(__file__), '..', 'site.db')}"
+    app.config['SQLALCHEMY_DATABASE_URI'] = resolve_database_uri(app.config['SQLALCHEMY_DATABASE_URI'])
+    if test_config:
+        app.config.update(test_config)
+
+    # Behind Render's proxy remote_addr is the proxy; trust the configured
+    # number of X-Forwarded-* hops so per-IP rate limits see the real client.
+    if app.config['PROXY_FIX_X_FOR']:
+        from werkzeug.middleware.proxy_fix import ProxyFix
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config['PROXY_FIX_X_FOR'],
+                                x_proto=app.config['PROXY_FIX_X_FOR'])
     
     # Initialize extensions with proper paths
     db.init_app(app)
-    migrate.init_app(app, db, directory=os.path.join(os.path.dirname(__file__), '..', 'migrations'))
+    if with_migrations:
+        # Only the CLI (flask db ...) needs Flask-Migrate/Alembic
+        from flask_migrate import Migrate
+        Migrate(app, db, directory=MIGRATIONS_DIR)
     jwt = JWTManager(app)
     bcrypt.init_app(app)
+    compress.init_app(app)
+    limiter.init_app(app)
+    request_cache.init_app(app)
+    from backend.audit import audit_log
+    audit_log.init_app(app)
 
     # Configure CORS (keep your existing CORS configuration)
     CORS(app, resources={
         r"/api/*": {
-            "origins": [
-                "https://phase4proj-fleemrkt.vercel.app",
-                "http://localhost:5173"
-            ],
+            "origins": app.config['CORS_ORIGINS'],
             "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-            "allow_headers": ["Content-Type", "Authorization"],
+            "allow_headers": ["Content-Type", "Authorization", "Idempotency-Key"],
             "supports_credentials": True,
-            "expose_headers": ["Authorization", "X-CSRF-TOKEN"],
+            "expose_headers": ["Authorization", "X-CSRF-TOKEN", "Retry-After", "Idempotent-Replayed"],
             "max_age": 86400
         }
     })
@@ -38,20 +72,35 @@ def create_app():
     # Register blueprints
     from backend.views.auth import auth_bp
     from backend.views.item import item_bp
+    from backend.views.myrequest import request_bp
+    from backend.views.admin import admin_bp
+    from backend.views.health import health_bp
     app.register_blueprint(auth_bp, url_prefix='/api')
     app.register_blueprint(item_bp, url_prefix='/api')
+    app.register_blueprint(request_bp, url_prefix='/api')
+    app.register_blueprint(admin_bp, url_prefix='/api')
+    app.register_blueprint(health_bp)
+
+    # Register CLI commands (flask archive-requests, ...)
+    from backend.commands import register_commands
+    register_commands(app)
 
     # Configure logging
     logging.basicConfig(level=logging.INFO)
     app.logger.setLevel(logging.INFO)
 
-    @app.route('/health')
-    def health_check():
-        return {'status': 'healthy'}, 200
-
     return app
 
-app = create_app()
+_app = None
+
+def __getattr__(name):
+    # Lazily build the module-level `app` for callers that still import it
+    global _app
+    if name == 'app':
+        if _app is None:
+            _app = create_app()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == '__main__':
-    app.run()
\ No newline at end of file
+    create_app().run()
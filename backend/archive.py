@@ -0,0 +1,79 @@
+# backend/archive.py
+# Moves finished requests from the hot `request` table into `request_archive`.
+# Each batch is an INSERT ... SELECT followed by a DELETE of the same ids,
+# committed together so a crash never loses or duplicates a row. On
+# PostgreSQL the batch's rows are locked when picked (FOR UPDATE SKIP LOCKED),
+# so a concurrent status change cannot slip in before they are moved; both
+# statements also repeat the finished/cutoff conditions, so a row that no
+# longer matches is left in the live table rather than archived.
+
+from datetime import date, datetime
+
+from sqlalchemy import delete, func, insert, literal, select, text
+
+from backend.extensions import db
+from backend.models import ArchivedRequest, Request, REQUEST_FINISHED_STATUSES
+
+ARCHIVE_COLUMNS = ['id', 'requested_at', 'item_id', 'requester_id', 'item_owner_id', 'status']
+
+
+def _month_start(value):
+    return date(value.year, value.month, 1)
+
+
+def _next_month(value):
+    return date(value.year + (value.month == 12), value.month % 12 + 1, 1)
+
+
+def ensure_archive_partitions(start, end):
+    # On PostgreSQL request_archive is partitioned by month of requested_at.
+    # Create any missing monthly partitions covering [start, end].
+    if db.engine.dialect.name != 'postgresql':
+        return
+    month = _month_start(start)
+    while month <= end.date():
+        upper = _next_month(month)
+        db.session.execute(text(
+            f"CREATE TABLE IF NOT EXISTS request_archive_y{month.year}m{month.month:02d} "
+            f"PARTITION OF request_archive FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+        ))
+        month = upper
+
+
+def archive_finished_requests(cutoff, batch_size=1000):
+    """Archive rejected/completed requests made before `cutoff`.
+
+    Returns the number of rows moved.
+    """
+    moved = 0
+    archivable = (Request.status.in_(REQUEST_FINISHED_STATUSES), Request.requested_at < cutoff)
+    while True:
+        ids = db.session.execute(
+            select(Request.id)
+            .where(*archivable)
+            .order_by(Request.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        ).scalars().all()
+        if not ids:
+            break
+
+        oldest, newest = db.session.execute(
+            select(func.min(Request.requested_at), func.max(Request.requested_at))
+            .where(Request.id.in_(ids))
+        ).one()
+        ensure_archive_partitions(oldest, newest)
+
+        archived_at = literal(datetime.utcnow(), ArchivedRequest.archived_at.type)
+        db.session.execute(
+            insert(ArchivedRequest).from_select(
+                ARCHIVE_COLUMNS + ['archived_at'],
+                select(*(getattr(Request, name) for name in ARCHIVE_COLUMNS), archived_at)
+                .where(Request.id.in_(ids), *archivable)
+            )
+        )
+        moved += db.session.execute(
+            delete(Request).where(Request.id.in_(ids), *archivable).execution_options(synchronize_session=False)
+        ).rowcount
+        db.session.commit()
+    return moved
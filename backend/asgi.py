@@ -0,0 +1,147 @@
+# backend/asgi.py
+# Async (ASGI) entry point for the read-heavy public routes:
+#
+#     uvicorn backend.asgi:app --workers 2
+#
+# Serves GET /api/items (listing and ?q=&category= search) and the health
+# probes with async handlers on an async SQLAlchemy engine, so one process
+# can keep many requests waiting on the database at once. Everything else
+# (auth, writes, admin) stays on the Flask app in backend/wsgi.py; route
+# /api/items GET and /health* here at the proxy and the rest there.
+#
+# Models, the item listing query and settings are shared with the Flask app
+# (backend/models.py, backend/views/item.py, backend/config.py), so both
+# entry points always agree on schema, payload and configuration.
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+from dotenv import load_dotenv
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from backend.app import resolve_database_uri
+
+load_dotenv()
+
+from backend.config import Config  # noqa: E402 - reads the environment loaded above
+from backend.views.health import migration_status, pool_status  # noqa: E402
+from backend.views.item import item_listing_query, item_listing_row  # noqa: E402
+
+# Sync driver URL -> async driver URL
+ASYNC_DRIVERS = {
+    'sqlite': 'sqlite+aiosqlite',
+    'postgres': 'postgresql+asyncpg',
+    'postgresql': 'postgresql+asyncpg',
+    'postgresql+psycopg2': 'postgresql+asyncpg',
+}
+
+
+def async_database_uri(uri):
+    uri = resolve_database_uri(uri)
+    scheme, sep, rest = uri.partition('://')
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+
+def create_engine():
+    options = dict(Config.SQLALCHEMY_ENGINE_OPTIONS)
+    return create_async_engine(async_database_uri(Config.SQLALCHEMY_DATABASE_URI), **options)
+
+
+engine = None
+_ping_cache = {'checked_at': None, 'result': None}
+_ping_lock = asyncio.Lock()
+
+
+@asynccontextmanager
+async def lifespan(app):
+    # One engine (and pool) per worker process, created after fork
+    global engine
+    engine = create_engine()
+    yield
+    await engine.dispose()
+
+
+async def get_items(request):
+    # Same query and payload as item.get_items
+    async with engine.connect() as connection:
+        rows = (await connection.execute(item_listing_query(request.query_params))).all()
+    return JSONResponse([item_listing_row(row) for row in rows])
+
+
+async def health_check(request):
+    return JSONResponse({'status': 'healthy'})
+
+
+async def liveness(request):
+    return JSONResponse({'status': 'alive'})
+
+
+async def _ping():
+    started = time.monotonic()
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text('SELECT 1'))
+            try:
+                revisions = set((await connection.execute(text('SELECT version_num FROM alembic_version'))).scalars())
+            except Exception:
+                revisions = None
+                await connection.rollback()
+    except Exception as exc:
+        return {'ok': False, 'error': type(exc).__name__}
+    return {
+        'ok': True,
+        'latency_ms': round((time.monotonic() - started) * 1000, 2),
+        'migrations': migration_status(revisions),
+    }
+
+
+async def readiness(request):
+    # Same checks as health.readiness: pool exhaustion short-circuits, then a
+    # DB ping and Alembic head check cached for HEALTH_DB_PING_TTL seconds,
+    # with one ping in flight at a time.
+    pool = pool_status(engine.pool)
+    if pool.get('exhausted'):
+        return JSONResponse({'status': 'unready', 'reason': 'pool_exhausted', 'pool': pool}, status_code=503)
+
+    now = time.monotonic()
+    checked_at = _ping_cache['checked_at']
+    if checked_at is None or now - checked_at >= Config.HEALTH_DB_PING_TTL:
+        async with _ping_lock:
+            if _ping_cache['checked_at'] == checked_at:
+                result = await _ping()
+                _ping_cache['result'], _ping_cache['checked_at'] = result, time.monotonic()
+
+    database = _ping_cache['result']
+    ready = database['ok'] and database['migrations']['up_to_date'] is not False
+    body = {
+        'status': 'ready' if ready else 'unready',
+        'database': database,
+        'pool': pool,
+    }
+    return JSONResponse(body, status_code=200 if ready else 503)
+
+
+app = Starlette(
+    routes=[
+        Route('/api/items', get_items, methods=['GET']),
+        Route('/health', health_check, methods=['GET']),
+        Route('/health/live', liveness, methods=['GET']),
+        Route('/health/ready', readiness, methods=['GET']),
+    ],
+    middleware=[
+        Middleware(CORSMiddleware, allow_origins=Config.CORS_ORIGINS, allow_credentials=True,
+                   allow_methods=['GET', 'OPTIONS'], allow_headers=['Content-Type', 'Authorization'],
+                   max_age=86400),
+        Middleware(GZipMiddleware, minimum_size=Config.COMPRESS_MIN_SIZE,
+                   compresslevel=Config.COMPRESS_GZIP_LEVEL),
+    ],
+    lifespan=lifespan,
+)
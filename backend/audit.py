@@ -0,0 +1,210 @@
+# backend/audit.py
+# Append-only audit log with buffered, batched writes.
+#
+# audit_log.record(...) only appends to an in-memory buffer, so views pay no
+# extra commit. The buffer is written with one multi-row INSERT when it reaches
+# AUDIT_FLUSH_SIZE events or every AUDIT_FLUSH_INTERVAL seconds (background
+# thread), and once more at interpreter shutdown. If the database cannot be
+# reached, the batch is appended to a JSON-lines spool file (AUDIT_SPOOL_PATH)
+# and replayed by the next successful flush.
+#
+# A flush claims the spool by renaming it to <spool>.<pid>; the claim file is
+# only removed once its events are inserted or re-spooled, and claim files
+# left behind by dead processes are picked up again. Spool lines that cannot
+# be parsed are moved to <spool>.bad. If the spool cannot be written either,
+# events go back into the buffer, which holds at most AUDIT_MAX_BUFFER events
+# (oldest dropped first).
+
+import atexit
+import glob
+import json
+import os
+import threading
+from datetime import datetime
+
+from sqlalchemy import insert
+
+from backend.extensions import db
+from backend.models import AuditEvent
+
+
+class AuditLog:
+    """Flask extension buffering audit events in memory."""
+
+    def __init__(self, app=None):
+        self.app = None
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pid = None
+        self.dropped = 0
+        self._atexit_registered = False
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('AUDIT_FLUSH_SIZE', 100)
+        app.config.setdefault('AUDIT_FLUSH_INTERVAL', 2.0)
+        app.config.setdefault('AUDIT_MAX_BUFFER', 10000)
+        app.config.setdefault('AUDIT_SPOOL_PATH', os.path.join(app.instance_path, 'audit_spool.jsonl'))
+        self.app = app
+        app.extensions['audit_log'] = self
+        # Once per instance: create_app() may run many times in one process
+        # (tests, CLI), and the flush always targets the latest app anyway.
+        if not self._atexit_registered:
+            atexit.register(self.flush)
+            self._atexit_registered = True
+
+    def _ensure_flusher(self):
+        # Started lazily and per process, so gunicorn workers forked from a
+        # preloaded master each get their own flusher thread.
+        if self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._buffer = []
+        threading.Thread(target=self._run_flusher, name='audit-flusher', daemon=True).start()
+
+    def _run_flusher(self):
+        interval = self.app.config['AUDIT_FLUSH_INTERVAL']
+        while True:
+            self._wakeup.wait(interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                # Keep the thread alive; unwritten events stay buffered or spooled
+                self.app.logger.exception("Audit flush failed")
+
+    def record(self, action, actor_id=None, target_type=None, target_id=None, **details):
+        event = {
+            'created_at': datetime.utcnow(),
+            'actor_id': actor_id,
+            'action': action,
+            'target_type': target_type,
+            'target_id': target_id,
+            'details': json.dumps(details, default=str) if details else None,
+        }
+        with self._lock:
+            self._ensure_flusher()
+            self._buffer.append(event)
+            self._trim_buffer()
+            full = len(self._buffer) >= self.app.config['AUDIT_FLUSH_SIZE']
+        if full:
+            self._wakeup.set()
+
+    def _trim_buffer(self):
+        # Caller holds self._lock
+        excess = len(self._buffer) - self.app.config['AUDIT_MAX_BUFFER']
+        if excess > 0:
+            del self._buffer[:excess]
+            self.dropped += excess
+
+    def _requeue(self, events):
+        # Puts events that could be neither inserted nor spooled back in front
+        with self._lock:
+            self._buffer[:0] = events
+            self._trim_buffer()
+
+    @staticmethod
+    def _pid_alive(pid):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    def _claim_spool(self):
+        # Returns this process's claim file, renaming the spool (or a claim
+        # orphaned by a dead process) to it if there is no leftover claim.
+        path = self.app.config['AUDIT_SPOOL_PATH']
+        claimed = f"{path}.{os.getpid()}"
+        if os.path.exists(claimed):
+            return claimed
+        orphans = []
+        for candidate in glob.glob(f"{glob.escape(path)}.*"):
+            suffix = candidate[len(path) + 1:]
+            if suffix.isdigit() and not self._pid_alive(int(suffix)):
+                orphans.append(candidate)
+        for source in [path] + orphans:
+            try:
+                os.replace(source, claimed)
+                return claimed
+            except FileNotFoundError:
+                continue  # no spool, or another process claimed it first
+        return None
+
+    def _read_spool(self):
+        claimed = self._claim_spool()
+        if claimed is None:
+            return [], None
+        events, bad_lines = [], []
+        with open(claimed) as spool:
+            for line in spool:
+                if not line.strip():
+                    continue
+                try:
+                    event = json.loads(line)
+                    event['created_at'] = datetime.fromisoformat(event['created_at'])
+                    if not event.get('action'):
+                        raise ValueError("missing action")
+                except (ValueError, KeyError, TypeError):
+                    bad_lines.append(line if line.endswith('\n') else line + '\n')
+                    continue
+                events.append(event)
+        if bad_lines:
+            self.app.logger.warning("Audit spool: moved %d unreadable line(s) to %s.bad", len(bad_lines),
+                                    self.app.config['AUDIT_SPOOL_PATH'])
+            with open(f"{self.app.config['AUDIT_SPOOL_PATH']}.bad", 'a') as rejected:
+                rejected.writelines(bad_lines)
+        return events, claimed
+
+    def _write_spool(self, events):
+        path = self.app.config['AUDIT_SPOOL_PATH']
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'a') as spool:
+            for event in events:
+                spool.write(json.dumps({**event, 'created_at': event['created_at'].isoformat()}) + '\n')
+
+    def flush(self):
+        # Writes all buffered (and previously spooled) events; returns the count.
+        if self.app is None:
+            return 0
+        with self._flush_lock:
+            with self.app.app_context():
+                spooled, claimed = self._read_spool()
+                with self._lock:
+                    buffered, self._buffer = self._buffer, []
+                    dropped, self.dropped = self.dropped, 0
+                if dropped:
+                    self.app.logger.error("Audit buffer full, dropped %d event(s)", dropped)
+                events = spooled + buffered
+                if not events:
+                    if claimed:
+                        os.remove(claimed)
+                    return 0
+                try:
+                    with db.engine.begin() as connection:
+                        connection.execute(insert(AuditEvent), events)
+                except Exception as exc:
+                    self.app.logger.error("Audit flush failed, spooling %d event(s): %s", len(events), exc)
+                    try:
+                        self._write_spool(events)
+                    except Exception as spool_exc:
+                        # The claim file still holds the spooled events; keep
+                        # the rest in memory for the next flush.
+                        self.app.logger.error("Audit spool write failed, keeping %d event(s) buffered: %s",
+                                              len(buffered), spool_exc)
+                        self._requeue(buffered)
+                        return 0
+                    events = []
+                if claimed:
+                    os.remove(claimed)
+            return len(events)
+
+
+# Shared instance; it imports the models, so it lives here rather than in
+# backend/extensions.py.
+audit_log = AuditLog()
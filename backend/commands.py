@@ -0,0 +1,69 @@
+# backend/commands.py
+# Custom `flask` CLI commands, registered on the app in create_app().
+
+import os
+from datetime import datetime, timedelta
+
+import click
+from flask.cli import with_appcontext
+
+
+@click.command("archive-requests")
+@click.option("--older-than", "older_than", type=int, required=True,
+              help="Archive rejected/completed requests made more than this many days ago.")
+@click.option("--batch-size", type=int, default=1000, show_default=True,
+              help="Rows moved per transaction.")
+@with_appcontext
+def archive_requests(older_than, batch_size):
+    """Move finished requests into the request_archive table."""
+    from backend.archive import archive_finished_requests
+
+    cutoff = datetime.utcnow() - timedelta(days=older_than)
+    moved = archive_finished_requests(cutoff, batch_size=batch_size)
+    click.echo(f"Archived {moved} request(s) made before {cutoff.isoformat()}")
+
+
+@click.command("purge-idempotency-keys")
+@click.option("--batch-size", type=int, default=5000, show_default=True,
+              help="Rows deleted per transaction.")
+@with_appcontext
+def purge_idempotency_keys(batch_size):
+    """Delete expired Idempotency-Key records."""
+    from backend.idempotency import purge_expired_keys
+
+    purged = purge_expired_keys(batch_size=batch_size)
+    click.echo(f"Purged {purged} expired idempotency key(s)")
+
+
+@click.command("export")
+@click.option("--table", "tables", multiple=True,
+              type=click.Choice(["users", "items", "requests", "archived_requests"]),
+              help="Table to export; repeat for several. Defaults to all.")
+@click.option("--format", "output_format", type=click.Choice(["csv", "parquet"]), default="csv",
+              show_default=True, help="gzip CSV, or Parquet (requires pyarrow).")
+@click.option("--since", type=click.DateTime(), default=None,
+              help="Only rows created/requested/archived after this time (incremental export).")
+@click.option("--output-dir", type=click.Path(file_okay=False), default="exports", show_default=True)
+@click.option("--chunk-size", type=int, default=5000, show_default=True,
+              help="Rows read per primary-key chunk.")
+@with_appcontext
+def export(tables, output_format, since, output_dir, chunk_size):
+    """Export tables to compressed CSV or Parquet files."""
+    from backend.export import EXPORT_TABLES, current_watermark, export_csv, export_parquet
+
+    os.makedirs(output_dir, exist_ok=True)
+    writer, extension = (export_csv, "csv.gz") if output_format == "csv" else (export_parquet, "parquet")
+    for name in tables or EXPORT_TABLES:
+        # Read the watermark first: rows added during the export are picked
+        # up again next time rather than missed.
+        watermark = current_watermark(name)
+        path = os.path.join(output_dir, f"{name}.{extension}")
+        count = writer(name, path, since=since, chunk_size=chunk_size)
+        next_since = f", next --since {watermark.isoformat()}" if watermark else ""
+        click.echo(f"{name}: {count} row(s) -> {path}{next_since}")
+
+
+def register_commands(app):
+    app.cli.add_command(archive_requests)
+    app.cli.add_command(purge_idempotency_keys)
+    app.cli.add_command(export)
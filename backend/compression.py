@@ -0,0 +1,121 @@
+# backend/compression.py
+# Negotiated gzip/brotli compression for API responses.
+# Bodies under a size threshold, streamed responses and already-encoded
+# responses are passed through untouched. Compressed bodies of cacheable
+# (GET, 200) responses are kept in a small LRU keyed by a digest of the
+# uncompressed body, so a hot listing is compressed once, not once per request.
+
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+
+from flask import current_app, request
+
+try:  # Brotli is optional; without it we only ever negotiate gzip.
+    import brotli
+except ImportError:  # pragma: no cover - depends on the deployment
+    brotli = None
+
+
+class CompressedBodyCache:
+    """Thread-safe LRU of compressed bodies, bounded by total bytes."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def set(self, key, body):
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._entries[key] = body
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class Compress:
+    """Flask extension that compresses responses in an after_request hook."""
+
+    def __init__(self, app=None):
+        self.cache = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('COMPRESS_MIMETYPES', ['application/json', 'text/html', 'text/plain', 'text/csv'])
+        app.config.setdefault('COMPRESS_MIN_SIZE', 1024)
+        # JSON is highly repetitive: gzip 6 / brotli 5 capture nearly all of the
+        # ratio of the max levels at a fraction of the CPU cost.
+        app.config.setdefault('COMPRESS_GZIP_LEVEL', 6)
+        app.config.setdefault('COMPRESS_BR_QUALITY', 5)
+        app.config.setdefault('COMPRESS_CACHE_MAX_BYTES', 8 * 1024 * 1024)
+
+        self.cache = CompressedBodyCache(app.config['COMPRESS_CACHE_MAX_BYTES'])
+        app.extensions['compress'] = self
+        app.after_request(self.after_request)
+
+    def _choose_encoding(self):
+        offered = ['br', 'gzip'] if brotli is not None else ['gzip']
+        return request.accept_encodings.best_match(offered)
+
+    def _compress(self, body, encoding, config):
+        if encoding == 'br':
+            return brotli.compress(body, quality=config['COMPRESS_BR_QUALITY'])
+        return gzip.compress(body, compresslevel=config['COMPRESS_GZIP_LEVEL'], mtime=0)
+
+    def after_request(self, response):
+        config = current_app.config
+
+        # Always advertise that the representation depends on Accept-Encoding,
+        # even when we end up not compressing this particular body.
+        response.vary.add('Accept-Encoding')
+
+        if (response.direct_passthrough or response.is_streamed
+                or response.status_code < 200 or response.status_code >= 300
+                or response.status_code == 204
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in config['COMPRESS_MIMETYPES']):
+            return response
+
+        encoding = self._choose_encoding()
+        if encoding is None:
+            return response
+
+        body = response.get_data()
+        if len(body) < config['COMPRESS_MIN_SIZE']:
+            return response
+
+        cacheable = request.method == 'GET' and response.status_code == 200
+        if cacheable:
+            key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+            compressed = self.cache.get(key)
+            if compressed is None:
+                compressed = self._compress(body, encoding, config)
+                self.cache.set(key, compressed)
+        else:
+            compressed = self._compress(body, encoding, config)
+
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        response.headers['Content-Length'] = str(len(compressed))
+        return response
@@ -1,14 +1,19 @@
 import os
 from datetime import timedelta
-from dotenv import load_dotenv
-
-load_dotenv()
 
+# The environment (including .env) is loaded by create_app() before this
+# module is imported, so importing it has no side effects.
 class Config:
     # Core Flask Config
     SECRET_KEY = os.getenv('SECRET_KEY', os.urandom(32))
     PROPAGATE_EXCEPTIONS = True
     
+    # Frontends allowed to call the API (used by both the WSGI and ASGI apps)
+    CORS_ORIGINS = [
+        "https://phase4proj-fleemrkt.vercel.app",
+        "http://localhost:5173"
+    ]
+
     # Database Config
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'sqlite:///instance/site.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
@@ -33,4 +38,65 @@ class Config:
     SESSION_COOKIE_SECURE = True
     SESSION_COOKIE_SAMESITE = 'None'
     REMEMBER_COOKIE_SECURE = True
-    REMEMBER_COOKIE_SAMESITE = 'None'
\ No newline at end of file
+    REMEMBER_COOKIE_SAMESITE = 'None'
+
+    # Response compression (see backend/compression.py)
+    COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', 1024))
+    COMPRESS_GZIP_LEVEL = 6
+    COMPRESS_BR_QUALITY = 5
+    COMPRESS_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+    # Batch endpoints: upper bound on IDs accepted per call
+    BATCH_MAX_IDS = int(os.getenv('BATCH_MAX_IDS', 500))
+
+    # Request history pagination (/api/requests/*/history)
+    HISTORY_PER_PAGE = 20
+    HISTORY_MAX_PER_PAGE = 100
+
+    # Admin analytics: longest date range accepted by /api/admin/stats
+    STATS_MAX_DAYS = 366
+
+    # Number of reverse proxies in front of the app (Render adds one). Their
+    # X-Forwarded-For/-Proto entries are trusted; 0 disables ProxyFix.
+    PROXY_FIX_X_FOR = int(os.getenv('PROXY_FIX_X_FOR', 1))
+
+    # Rate limiting (see backend/ratelimit.py). Use a redis:// URL to share
+    # buckets between gunicorn workers.
+    RATELIMIT_ENABLED = os.getenv('RATELIMIT_ENABLED', 'true').lower() == 'true'
+    RATELIMIT_STORAGE_URL = os.getenv('RATELIMIT_STORAGE_URL', 'memory://')
+    RATELIMIT_LOGIN_PER_IP = '20/minute'
+    RATELIMIT_LOGIN_PER_USERNAME = '5/minute'
+    RATELIMIT_REGISTER_PER_IP = '5/hour'
+
+    # Idempotency-Key replay window for POST endpoints
+    IDEMPOTENCY_TTL = timedelta(hours=24)
+    # How long an in-flight request holds its key before a retry may take it
+    # over (the worker running it is assumed dead). Keep above gunicorn's
+    # worker timeout.
+    IDEMPOTENCY_LOCK_TIMEOUT = timedelta(seconds=60)
+
+    # Readiness probe: seconds a DB ping result is reused
+    HEALTH_DB_PING_TTL = float(os.getenv('HEALTH_DB_PING_TTL', 5))
+
+    # Per-user cache of /api/requests/sent and /received (see backend/request_cache.py).
+    # memory:// lives inside each worker and only that worker sees its
+    # invalidations, so with several gunicorn workers other workers would serve
+    # stale lists for up to REQUEST_CACHE_TTL. The cache is therefore off unless
+    # REQUEST_CACHE_URL is a shared (redis://) store; memory:// can be enabled
+    # explicitly for single-process deployments and is refused when
+    # WEB_CONCURRENCY > 1.
+    REQUEST_CACHE_URL = os.getenv('REQUEST_CACHE_URL', 'memory://')
+    REQUEST_CACHE_ENABLED = os.getenv(
+        'REQUEST_CACHE_ENABLED', str(not REQUEST_CACHE_URL.startswith('memory://'))
+    ).lower() == 'true'
+    REQUEST_CACHE_MAX_USERS = 10000
+    REQUEST_CACHE_TTL = 300
+
+    # Audit log batching (see backend/audit.py)
+    AUDIT_FLUSH_SIZE = 100
+    AUDIT_FLUSH_INTERVAL = 2.0
+    AUDIT_MAX_BUFFER = 10000  # events held in memory while the DB and spool are unavailable
+    AUDIT_MAX_PER_PAGE = 200
+
+    # Rows per primary-key chunk for /api/admin/export
+    EXPORT_CHUNK_SIZE = 5000
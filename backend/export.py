@@ -0,0 +1,142 @@
+# backend/export.py
+# Bulk export of marketplace tables for offline analysis.
+#
+# Tables are read with Core selects in primary-key order, `chunk_size` rows at
+# a time (WHERE id > last_id ORDER BY id LIMIT n), so no ORM objects or
+# identity map are involved and memory stays constant however large the
+# table. Output is gzip-compressed CSV, written incrementally, or Parquet
+# (one row group per chunk) when pyarrow is installed.
+#
+# Incremental exports pass `since`: only rows whose watermark column
+# (items.created_at, requests.requested_at, request_archive.archived_at) is
+# newer are exported. Archived rows are watermarked by when they were moved,
+# not when they were made: requests are archived long after requested_at, so
+# that would put them behind an earlier export's watermark. Users have no
+# timestamp column and are always exported in full.
+
+import csv
+import io
+import zlib
+from datetime import datetime
+
+from sqlalchemy import func, select, types
+
+from backend.extensions import db
+from backend.models import ArchivedRequest, Item, Request, User
+
+# name -> (table, exported columns, watermark column or None)
+EXPORT_TABLES = {
+    'users': (User.__table__, ['id', 'username', 'email', 'role'], None),  # never export password hashes
+    'items': (Item.__table__, None, 'created_at'),
+    'requests': (Request.__table__, None, 'requested_at'),
+    'archived_requests': (ArchivedRequest.__table__, None, 'archived_at'),
+}
+
+
+def _columns(name):
+    table, column_names, _ = EXPORT_TABLES[name]
+    if column_names is None:
+        return list(table.columns)
+    return [table.c[column_name] for column_name in column_names]
+
+
+def iter_chunks(name, since=None, chunk_size=5000):
+    # Yields lists of row tuples, in primary-key order
+    table, _, watermark = EXPORT_TABLES[name]
+    columns = _columns(name)
+    pk = table.c.id
+    pk_index = columns.index(pk)
+    last_id = None
+    with db.engine.connect() as connection:
+        while True:
+            query = select(*columns).order_by(pk).limit(chunk_size)
+            if last_id is not None:
+                query = query.where(pk > last_id)
+            if since is not None and watermark is not None:
+                query = query.where(table.c[watermark] > since)
+            rows = connection.execute(query).all()
+            if not rows:
+                return
+            yield rows
+            last_id = rows[-1][pk_index]
+
+
+def _format_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def csv_gzip_stream(name, chunks):
+    # Turns an iterator of row chunks into gzip-compressed CSV bytes, one
+    # compressed block per chunk
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([column.name for column in _columns(name)])
+    for rows in chunks:
+        writer.writerows([_format_value(value) for value in row] for row in rows)
+        data = compressor.compress(buffer.getvalue().encode('utf-8'))
+        buffer.seek(0)
+        buffer.truncate()
+        if data:
+            yield data
+    yield compressor.compress(buffer.getvalue().encode('utf-8')) + compressor.flush()
+
+
+def export_csv(name, path, since=None, chunk_size=5000):
+    # Writes <path> as gzip CSV; returns the number of data rows
+    count = 0
+
+    def counted():
+        nonlocal count
+        for rows in iter_chunks(name, since, chunk_size):
+            count += len(rows)
+            yield rows
+
+    with open(path, 'wb') as output:
+        for data in csv_gzip_stream(name, counted()):
+            output.write(data)
+    return count
+
+
+def _arrow_type(pa, column):
+    # Explicit types, so an all-NULL first chunk can't fix a column as null
+    if isinstance(column.type, types.Boolean):
+        return pa.bool_()
+    if isinstance(column.type, types.Integer):
+        return pa.int64()
+    if isinstance(column.type, types.Float):
+        return pa.float64()
+    if isinstance(column.type, types.DateTime):
+        return pa.timestamp('us')
+    if isinstance(column.type, types.Date):
+        return pa.date32()
+    return pa.string()
+
+
+def export_parquet(name, path, since=None, chunk_size=5000):
+    # Writes <path> as zstd-compressed Parquet, one row group per chunk;
+    # returns the number of rows
+    import pyarrow as pa  # optional dependency, only needed for Parquet output
+    import pyarrow.parquet as pq
+
+    columns = _columns(name)
+    schema = pa.schema([pa.field(column.name, _arrow_type(pa, column)) for column in columns])
+    count = 0
+    with pq.ParquetWriter(path, schema, compression='zstd') as writer:
+        for rows in iter_chunks(name, since, chunk_size):
+            writer.write_table(pa.Table.from_pydict({
+                column.name: [row[index] for row in rows] for index, column in enumerate(columns)
+            }, schema=schema))
+            count += len(rows)
+    return count
+
+
+def current_watermark(name):
+    # Highest watermark value in the table, to pass as `since` next time
+    table, _, watermark = EXPORT_TABLES[name]
+    if watermark is None:
+        return None
+    with db.engine.connect() as connection:
+        return connection.execute(select(func.max(table.c[watermark]))).scalar()
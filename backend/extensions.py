@@ -1,12 +1,18 @@
 # backend/extensions.py
 # This file initializes SQLAlchemy and Bcrypt instances.
 # It should NOT import app or models directly here.
+# Flask-Migrate is not created here: it pulls in Alembic, which serving
+# workers never need, so create_app() sets it up only when asked to.
 
 from flask_sqlalchemy import SQLAlchemy
 from flask_bcrypt import Bcrypt
-from flask_migrate import Migrate 
+from backend.compression import Compress
+from backend.ratelimit import Limiter
+from backend.request_cache import RequestListCache
 
 
 db = SQLAlchemy()
 bcrypt = Bcrypt()
-migrate = Migrate()
+compress = Compress()
+limiter = Limiter()
+request_cache = RequestListCache()
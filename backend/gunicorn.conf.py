@@ -0,0 +1,36 @@
+# backend/gunicorn.conf.py
+# Gunicorn settings for production (see Procfile).
+#
+# preload_app builds the Flask app once in the master; workers are forked from
+# it and share those pages copy-on-write instead of each importing and
+# initializing everything again.
+
+import gc
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+workers = int(os.getenv('WEB_CONCURRENCY', 2))
+preload_app = os.getenv('GUNICORN_PRELOAD', 'true').lower() == 'true'
+
+
+def when_ready(server):
+    # Move everything allocated during preload out of the GC's tracked
+    # generations, so collections in workers don't touch (and un-share) it.
+    if preload_app:
+        gc.freeze()
+
+
+def post_fork(server, worker):
+    # Connections opened in the master (if any) must not be shared with
+    # children; drop them without closing the parent's sockets.
+    if preload_app:
+        from backend.extensions import db
+        from backend.wsgi import app
+        with app.app_context():
+            db.engine.dispose(close=False)
+
+
+def worker_exit(server, worker):
+    # Write any audit events still buffered in this worker
+    from backend.audit import audit_log
+    audit_log.flush()
@@ -0,0 +1,186 @@
+# backend/idempotency.py
+# Idempotency-Key support for POST endpoints.
+#
+#     @item_bp.route('/items', methods=['POST'])
+#     @jwt_required()
+#     @idempotent()
+#     def create_item(): ...
+#
+# The first request with a given key reserves it, runs the view and stores the
+# status code and body. Retries with the same key and body get the stored
+# response back (with an Idempotent-Replayed header) without touching the main
+# tables. Keys expire after IDEMPOTENCY_TTL; `flask purge-idempotency-keys`
+# deletes expired ones in bulk.
+#
+# A reservation is locked for IDEMPOTENCY_LOCK_TIMEOUT. The view's own commit
+# also sets view_committed on the reservation (a before_commit hook), so the
+# write and that flag land together. If the worker dies mid-view the row never
+# gets a response; once the lock has lapsed the next retry takes it over and
+# runs the view itself, but only if view_committed is unset. Otherwise the
+# write happened and only the response was lost, so retries get a 409 rather
+# than a second write.
+
+import hashlib
+import math
+from datetime import datetime
+from functools import wraps
+
+from flask import current_app, g, has_app_context, jsonify, request
+from flask_jwt_extended import get_jwt_identity
+from sqlalchemy import delete, event, select, update
+from sqlalchemy.exc import IntegrityError
+
+from backend.extensions import db
+from backend.models import IdempotencyKey
+
+HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 64
+
+
+def _replay(record):
+    response = current_app.response_class(record.response_body, status=record.status_code,
+                                          mimetype='application/json')
+    response.headers['Idempotent-Replayed'] = 'true'
+    return response
+
+
+@event.listens_for(db.session, 'before_commit')
+def _mark_view_committed(session):
+    # Runs inside every commit; while an idempotent view is executing, the
+    # commit also flags its reservation.
+    reservation_id = g.get('idempotency_reservation_id') if has_app_context() else None
+    if reservation_id is not None:
+        session.execute(
+            update(IdempotencyKey).where(IdempotencyKey.id == reservation_id).values(view_committed=True)
+        )
+
+
+def _run_view(view, reservation_id, args, kwargs):
+    g.idempotency_reservation_id = reservation_id
+    try:
+        return current_app.make_response(view(*args, **kwargs))
+    finally:
+        g.pop('idempotency_reservation_id', None)
+
+
+def _release(reservation_id):
+    # Drops a reservation whose view failed so the client can retry, unless
+    # the view's write was committed; returns whether it was dropped.
+    db.session.rollback()  # never commit what the failed view left pending
+    deleted = db.session.execute(
+        delete(IdempotencyKey)
+        .where(IdempotencyKey.id == reservation_id, IdempotencyKey.view_committed.is_(False))
+    ).rowcount
+    db.session.commit()
+    return deleted == 1
+
+
+def _in_progress(locked_until, now):
+    response = jsonify({"msg": "A request with this Idempotency-Key is still in progress"})
+    response.status_code = 409
+    response.headers['Retry-After'] = str(max(1, math.ceil((locked_until - now).total_seconds())))
+    return response
+
+
+def _take_over(record, locked_until):
+    # Claims a reservation whose lock has lapsed; False if another retry won
+    if record.locked_until is None:
+        unchanged = IdempotencyKey.locked_until.is_(None)  # reserved before locks existed
+    else:
+        unchanged = IdempotencyKey.locked_until == record.locked_until
+    result = db.session.execute(
+        update(IdempotencyKey)
+        .where(IdempotencyKey.id == record.id, IdempotencyKey.status_code.is_(None),
+               IdempotencyKey.view_committed.is_(False), unchanged)
+        .values(locked_until=locked_until)
+    )
+    db.session.commit()
+    return result.rowcount == 1
+
+
+def idempotent(per_user=True):
+    # per_user=True scopes keys to the JWT identity, so it must be applied
+    # below @jwt_required(). Use per_user=False for anonymous endpoints; their
+    # keys are scoped to the client address so clients cannot collide.
+    def decorator(view):
+        @wraps(view)
+        def wrapped(*args, **kwargs):
+            key = request.headers.get(HEADER)
+            if not key:
+                return view(*args, **kwargs)
+            if len(key) > MAX_KEY_LENGTH:
+                return jsonify({"msg": f"{HEADER} must be at most {MAX_KEY_LENGTH} characters"}), 400
+
+            owner = get_jwt_identity()['id'] if per_user else f"ip:{request.remote_addr}"
+            scope = f"{request.endpoint}:{owner}"
+            request_hash = hashlib.sha256(request.get_data()).hexdigest()
+            now = datetime.utcnow()
+            locked_until = now + current_app.config['IDEMPOTENCY_LOCK_TIMEOUT']
+
+            record = IdempotencyKey.query.filter_by(scope=scope, key=key).first()
+            if record and record.expires_at <= now:
+                db.session.delete(record)
+                db.session.commit()
+                record = None
+            if record:
+                if record.request_hash != request_hash:
+                    return jsonify({"msg": f"{HEADER} was already used with a different request body"}), 422
+                if record.status_code is not None:
+                    return _replay(record)
+                if record.locked_until is not None and record.locked_until > now:
+                    return _in_progress(record.locked_until, now)
+                if record.view_committed:
+                    return jsonify({"msg": f"The request with this {HEADER} was already processed, "
+                                           "but its response was not saved"}), 409
+                if not _take_over(record, locked_until):
+                    return _in_progress(locked_until, now)
+                reservation_id = record.id
+            else:
+                # Reserve the key before running the view so concurrent
+                # retries cannot both perform the write.
+                reservation = IdempotencyKey(scope=scope, key=key, request_hash=request_hash,
+                                             locked_until=locked_until,
+                                             expires_at=now + current_app.config['IDEMPOTENCY_TTL'])
+                db.session.add(reservation)
+                try:
+                    db.session.commit()
+                except IntegrityError:
+                    db.session.rollback()
+                    return _in_progress(locked_until, now)
+                reservation_id = reservation.id
+
+            try:
+                response = _run_view(view, reservation_id, args, kwargs)
+            except Exception:
+                _release(reservation_id)
+                raise
+
+            if response.status_code >= 500 and _release(reservation_id):
+                return response
+            db.session.execute(
+                update(IdempotencyKey)
+                .where(IdempotencyKey.id == reservation_id)
+                .values(status_code=response.status_code, response_body=response.get_data(as_text=True),
+                        locked_until=None)
+            )
+            db.session.commit()
+            return response
+        return wrapped
+    return decorator
+
+
+def purge_expired_keys(batch_size=5000):
+    # Deletes expired keys in batches; returns the number removed.
+    purged = 0
+    now = datetime.utcnow()
+    while True:
+        ids = db.session.execute(
+            select(IdempotencyKey.id).where(IdempotencyKey.expires_at <= now).limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            return purged
+        db.session.execute(
+            delete(IdempotencyKey).where(IdempotencyKey.id.in_(ids)).execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        purged += len(ids)
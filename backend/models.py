@@ -52,18 +52,99 @@ class Item(db.Model):
     def __repr__(self):
         return f"Item('{self.title}', '{self.category}', '{self.owner.username}')"
 
+# Request lifecycle: active requests live in the `request` table; finished ones
+# are periodically moved to `request_archive` by `flask archive-requests`.
+REQUEST_ACTIVE_STATUSES = ('pending', 'accepted')
+REQUEST_FINISHED_STATUSES = ('rejected', 'completed')
+
 # Request Model: Represents a request from one user to another for an item.
 class Request(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     item_id = db.Column(db.Integer, db.ForeignKey('item.id'), nullable=False)
-    requester_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    item_owner_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False) # Owner of the item
+    requester_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
+    item_owner_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True) # Owner of the item
     status = db.Column(db.String(20), default='pending', nullable=False) # e.g., 'pending', 'accepted', 'rejected', 'completed'
     requested_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     
     def __repr__(self):
         return f"Request('{self.requester.username}' to '{self.item_owner.username}' for '{self.item.title}', Status: '{self.status}')"
 
+# ArchivedRequest Model: cold storage for finished (rejected/completed) requests.
+# Rows keep their original id. The primary key includes requested_at so the
+# table can be range-partitioned by it on PostgreSQL (see the migration).
+# No foreign keys: archived rows must survive deletion of items or users.
+class ArchivedRequest(db.Model):
+    __tablename__ = 'request_archive'
+    __table_args__ = (
+        db.Index('ix_request_archive_requester_requested_at', 'requester_id', 'requested_at'),
+        db.Index('ix_request_archive_owner_requested_at', 'item_owner_id', 'requested_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    requested_at = db.Column(db.DateTime, primary_key=True)
+    item_id = db.Column(db.Integer, nullable=False)
+    requester_id = db.Column(db.Integer, nullable=False)
+    item_owner_id = db.Column(db.Integer, nullable=False)
+    status = db.Column(db.String(20), nullable=False)
+    archived_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"ArchivedRequest(id={self.id}, status='{self.status}', requested_at='{self.requested_at}')"
+
+# DailyStat Model: per-day rollup counters read by /api/admin/stats.
+# One row per (day, metric, key), e.g. ('2025-06-25', 'new_items', 'Books').
+# `total` carries a summed quantity where a metric needs one (e.g. latency seconds).
+class DailyStat(db.Model):
+    __tablename__ = 'daily_stat'
+
+    day = db.Column(db.Date, primary_key=True)
+    metric = db.Column(db.String(40), primary_key=True)
+    key = db.Column(db.String(50), primary_key=True, default='')
+    count = db.Column(db.Integer, nullable=False, default=0)
+    total = db.Column(db.Float, nullable=False, default=0.0)
+
+    def __repr__(self):
+        return f"DailyStat('{self.day}', '{self.metric}', '{self.key}', count={self.count})"
+
+# IdempotencyKey Model: remembers the response to a POST sent with an
+# Idempotency-Key header so client retries replay it instead of re-running
+# the write. A row with a NULL status_code is a request still in flight.
+class IdempotencyKey(db.Model):
+    __tablename__ = 'idempotency_key'
+    __table_args__ = (db.UniqueConstraint('scope', 'key', name='uq_idempotency_key_scope_key'),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    scope = db.Column(db.String(80), nullable=False) # endpoint + user it was sent by
+    key = db.Column(db.String(64), nullable=False)
+    request_hash = db.Column(db.String(64), nullable=False) # sha256 of the request body
+    status_code = db.Column(db.Integer, nullable=True)
+    response_body = db.Column(db.Text, nullable=True)
+    locked_until = db.Column(db.DateTime, nullable=True) # set while the view runs; a retry may take over after it
+    view_committed = db.Column(db.Boolean, nullable=False, default=False, server_default=db.false()) # set by the view's own commit
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"IdempotencyKey(scope='{self.scope}', key='{self.key}', status_code={self.status_code})"
+
+# AuditEvent Model: append-only log of admin actions and request status changes.
+# Written in batches by backend/audit.py, never updated.
+class AuditEvent(db.Model):
+    __tablename__ = 'audit_event'
+    __table_args__ = (
+        db.Index('ix_audit_event_actor_created_at', 'actor_id', 'created_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
+    actor_id = db.Column(db.Integer, nullable=True) # user who performed the action
+    action = db.Column(db.String(50), nullable=False) # e.g. 'request.status_changed'
+    target_type = db.Column(db.String(30), nullable=True)
+    target_id = db.Column(db.Integer, nullable=True)
+    details = db.Column(db.Text, nullable=True) # JSON
+
+    def __repr__(self):
+        return f"AuditEvent('{self.action}', actor={self.actor_id}, target={self.target_type}:{self.target_id})"
+
 # Rating Model: For user-to-user ratings.
 class Rating(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -0,0 +1,177 @@
+# backend/ratelimit.py
+# Token-bucket rate limiting, declared per route:
+#
+#     @auth_bp.route('/login', methods=['POST'])
+#     @limiter.limit('RATELIMIT_LOGIN_PER_IP', by_ip)
+#     @limiter.limit('RATELIMIT_LOGIN_PER_USERNAME', by_json_field('username'))
+#     def login(): ...
+#
+# The first argument names a config setting holding a rate such as "10/minute";
+# the bucket holds that many tokens and refills continuously. Checks run before
+# the view body, so rejected requests never reach the database or bcrypt.
+#
+# Buckets live in process memory by default. Set RATELIMIT_STORAGE_URL to a
+# redis:// URL to share them across gunicorn workers (needs the `redis` package).
+
+import math
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, jsonify, request
+
+PERIODS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+
+
+def parse_rate(rate):
+    # "10/minute" -> (capacity=10, refill_per_second=10/60)
+    count, _, period = rate.partition('/')
+    period = period.strip().rstrip('s')
+    if period not in PERIODS:
+        raise ValueError(f"Invalid rate limit {rate!r}")
+    capacity = int(count)
+    return capacity, capacity / PERIODS[period]
+
+
+class MemoryStore:
+    """In-process token buckets guarded by striped locks.
+
+    Keys hash onto one of `stripes` locks, so concurrent requests for
+    different clients rarely contend. Each bucket remembers when it will be
+    full again at its own rate. A stripe that grows past its share of
+    `max_keys` is swept once: refilled buckets are dropped and, if that frees
+    too little, least recently used ones until the stripe is 10% under the
+    bound, so the sweep cost is spread over many calls.
+    """
+
+    def __init__(self, stripes=16, max_keys=100000):
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._buckets = [OrderedDict() for _ in range(stripes)]
+        self._max_keys_per_stripe = max(max_keys // stripes, 1)
+
+    def consume(self, key, capacity, refill_rate, now=None):
+        now = time.monotonic() if now is None else now
+        stripe = zlib.crc32(key.encode()) % len(self._locks)
+        buckets = self._buckets[stripe]
+        with self._locks[stripe]:
+            tokens, last, _ = buckets.get(key, (capacity, now, now))
+            tokens = min(capacity, tokens + (now - last) * refill_rate)
+            if tokens >= 1:
+                tokens -= 1
+                allowed, retry_after = True, 0.0
+            else:
+                allowed, retry_after = False, (1 - tokens) / refill_rate
+            # (tokens, last update, time the bucket is full again)
+            buckets[key] = (tokens, now, now + (capacity - tokens) / refill_rate)
+            buckets.move_to_end(key)
+            if len(buckets) > self._max_keys_per_stripe:
+                self._sweep(buckets, now)
+        return allowed, retry_after
+
+    def _sweep(self, buckets, now):
+        for key in [k for k, (_, _, full_at) in buckets.items() if full_at <= now]:
+            del buckets[key]
+        target = self._max_keys_per_stripe - max(self._max_keys_per_stripe // 10, 1)
+        while len(buckets) > target:
+            buckets.popitem(last=False)
+
+
+class RedisStore:
+    """Token buckets shared between processes through Redis.
+
+    The refill-and-take step runs as a Lua script, so it is atomic without
+    any client-side locking.
+    """
+
+    SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, tostring(retry_after)}
+"""
+
+    def __init__(self, url, prefix='ratelimit:'):
+        import redis  # optional dependency, only needed for a shared store
+        self._client = redis.Redis.from_url(url)
+        self._script = self._client.register_script(self.SCRIPT)
+        self._prefix = prefix
+
+    def consume(self, key, capacity, refill_rate, now=None):
+        now = time.time() if now is None else now
+        allowed, retry_after = self._script(keys=[self._prefix + key], args=[capacity, refill_rate, now])
+        return bool(allowed), float(retry_after)
+
+
+def create_store(url):
+    if url.startswith('memory://'):
+        return MemoryStore()
+    if url.startswith(('redis://', 'rediss://', 'unix://')):
+        return RedisStore(url)
+    raise ValueError(f"Unsupported RATELIMIT_STORAGE_URL {url!r}")
+
+
+# Key functions: return the identity a bucket is tracked for, or None to skip.
+def by_ip():
+    # remote_addr is the client address once ProxyFix (see create_app) has
+    # applied the trusted X-Forwarded-For hops.
+    return request.remote_addr or 'unknown'
+
+
+def by_json_field(field):
+    def key_func():
+        data = request.get_json(silent=True)
+        value = data.get(field) if isinstance(data, dict) else None
+        return str(value).lower() if value else None
+    return key_func
+
+
+class Limiter:
+    """Flask extension holding the bucket store and the @limit decorator."""
+
+    def __init__(self, app=None):
+        self.store = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('RATELIMIT_ENABLED', True)
+        app.config.setdefault('RATELIMIT_STORAGE_URL', 'memory://')
+        self.store = create_store(app.config['RATELIMIT_STORAGE_URL'])
+        app.extensions['limiter'] = self
+
+    def limit(self, rate_setting, key_func, scope=None):
+        def decorator(view):
+            bucket_scope = scope or f"{view.__name__}:{rate_setting}"
+
+            @wraps(view)
+            def wrapped(*args, **kwargs):
+                config = current_app.config
+                if config['RATELIMIT_ENABLED']:
+                    key = key_func()
+                    if key is not None:
+                        capacity, refill_rate = parse_rate(config[rate_setting])
+                        allowed, retry_after = self.store.consume(f"{bucket_scope}:{key}", capacity, refill_rate)
+                        if not allowed:
+                            response = jsonify({"msg": "Too many requests, please try again later"})
+                            response.status_code = 429
+                            response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+                            return response
+                return view(*args, **kwargs)
+            return wrapped
+        return decorator
@@ -0,0 +1,183 @@
+# backend/request_cache.py
+# Per-user cache of the dashboard request lists (/api/requests/sent and
+# /api/requests/received).
+#
+# Entries are dropped for exactly the users involved whenever a request row
+# changes (create_request, status updates, admin deletes). Each user has a
+# generation number that invalidation bumps; a list built from the database
+# is only stored if the generation is unchanged, so a slow reader can never
+# put back a list that an invalidation raced past.
+#
+# The in-process store is an LRU bounded by number of users, and is only
+# correct with a single worker process: invalidations are not seen by other
+# workers. Set REQUEST_CACHE_URL to a redis:// URL when running several.
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+LIST_KINDS = ('sent', 'received')
+
+
+class MemoryListStore:
+    """LRU of {kind: (expires_at, payload)} per user, guarded by one lock."""
+
+    def __init__(self, max_users, ttl):
+        self.max_users = max_users
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id, kind):
+        with self._lock:
+            lists = self._entries.get(user_id)
+            if not lists or kind not in lists:
+                return None
+            expires_at, payload = lists[kind]
+            if expires_at <= time.monotonic():
+                del lists[kind]
+                return None
+            self._entries.move_to_end(user_id)
+            return payload
+
+    def generation(self, user_id):
+        with self._lock:
+            return self._generations.get(user_id, 0)
+
+    def set(self, user_id, kind, payload, generation):
+        with self._lock:
+            if self._generations.get(user_id, 0) != generation:
+                return
+            self._entries.setdefault(user_id, {})[kind] = (time.monotonic() + self.ttl, payload)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_users:
+                evicted, _ = self._entries.popitem(last=False)
+                self._generations.pop(evicted, None)
+
+    def invalidate(self, user_ids):
+        with self._lock:
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+                # Only remember generations for users that may have a reader
+                # in flight; bounded by the same LRU size.
+                self._generations[user_id] = self._generations.get(user_id, 0) + 1
+            while len(self._generations) > self.max_users:
+                self._generations.pop(next(iter(self._generations)))
+
+
+class RedisListStore:
+    """Shared store: one hash per user plus a generation counter."""
+
+    SET_IF_CURRENT = """
+if (tonumber(redis.call('GET', KEYS[2])) or 0) ~= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('HSET', KEYS[1], ARGV[2], ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return 1
+"""
+
+    def __init__(self, url, ttl, prefix='reqcache:'):
+        import redis  # optional dependency, only needed for a shared store
+        self._client = redis.Redis.from_url(url)
+        self._set_if_current = self._client.register_script(self.SET_IF_CURRENT)
+        self.ttl = int(ttl)
+        self._prefix = prefix
+
+    def _keys(self, user_id):
+        return f"{self._prefix}{user_id}", f"{self._prefix}{user_id}:gen"
+
+    def get(self, user_id, kind):
+        raw = self._client.hget(self._keys(user_id)[0], kind)
+        return json.loads(raw) if raw is not None else None
+
+    def generation(self, user_id):
+        return int(self._client.get(self._keys(user_id)[1]) or 0)
+
+    def set(self, user_id, kind, payload, generation):
+        self._set_if_current(keys=self._keys(user_id),
+                             args=[generation, kind, json.dumps(payload), self.ttl])
+
+    def invalidate(self, user_ids):
+        pipe = self._client.pipeline()
+        for user_id in user_ids:
+            data_key, gen_key = self._keys(user_id)
+            pipe.delete(data_key)
+            pipe.incr(gen_key)
+            pipe.expire(gen_key, self.ttl * 2)
+        pipe.execute()
+
+
+class RequestListCache:
+    """Flask extension wrapping a list store with hit/miss counters."""
+
+    def __init__(self, app=None):
+        self.store = None
+        self.enabled = True
+        self._counter_lock = threading.Lock()
+        self.metrics = {kind: {'hits': 0, 'misses': 0} for kind in LIST_KINDS}
+        self.metrics['invalidations'] = 0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('REQUEST_CACHE_ENABLED', False)
+        app.config.setdefault('REQUEST_CACHE_URL', 'memory://')
+        app.config.setdefault('REQUEST_CACHE_MAX_USERS', 10000)
+        app.config.setdefault('REQUEST_CACHE_TTL', 300)
+
+        self.enabled = app.config['REQUEST_CACHE_ENABLED']
+        url = app.config['REQUEST_CACHE_URL']
+        if url.startswith('memory://'):
+            workers = int(os.getenv('WEB_CONCURRENCY', 1))
+            if self.enabled and workers > 1:
+                app.logger.warning(
+                    "REQUEST_CACHE_URL=memory:// cannot be invalidated across %d workers; "
+                    "request list cache disabled. Use a redis:// URL.", workers)
+                self.enabled = False
+            self.store = MemoryListStore(app.config['REQUEST_CACHE_MAX_USERS'], app.config['REQUEST_CACHE_TTL'])
+        elif url.startswith(('redis://', 'rediss://', 'unix://')):
+            self.store = RedisListStore(url, app.config['REQUEST_CACHE_TTL'])
+        else:
+            raise ValueError(f"Unsupported REQUEST_CACHE_URL {url!r}")
+        app.extensions['request_cache'] = self
+
+    def _count(self, kind, outcome):
+        with self._counter_lock:
+            self.metrics[kind][outcome] += 1
+
+    def get_or_build(self, user_id, kind, build):
+        # Returns the cached list for (user, kind), calling build() on a miss
+        if not self.enabled:
+            return build()
+        payload = self.store.get(user_id, kind)
+        if payload is not None:
+            self._count(kind, 'hits')
+            return payload
+        self._count(kind, 'misses')
+        generation = self.store.generation(user_id)
+        payload = build()
+        self.store.set(user_id, kind, payload, generation)
+        return payload
+
+    def invalidate(self, *user_ids):
+        # Call after the commit that changed requests involving these users
+        user_ids = {user_id for user_id in user_ids if user_id is not None}
+        if not self.enabled or not user_ids:
+            return
+        self.store.invalidate(user_ids)
+        with self._counter_lock:
+            self.metrics['invalidations'] += len(user_ids)
+
+    def stats(self):
+        with self._counter_lock:
+            stats = {kind: dict(self.metrics[kind]) for kind in LIST_KINDS}
+            stats['invalidations'] = self.metrics['invalidations']
+        for kind in LIST_KINDS:
+            lookups = stats[kind]['hits'] + stats[kind]['misses']
+            stats[kind]['hit_ratio'] = round(stats[kind]['hits'] / lookups, 3) if lookups else None
+        stats['backend'] = type(self.store).__name__
+        return stats
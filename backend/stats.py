@@ -0,0 +1,56 @@
+# backend/stats.py
+# Daily rollup counters for the admin analytics endpoint.
+# Write paths call record_stat() inside their own transaction; each call is a
+# single upsert on (day, metric, key), so the rollup commits atomically with
+# the change it describes and /api/admin/stats never touches the base tables.
+
+from datetime import datetime
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from backend.extensions import db
+from backend.models import DailyStat
+
+# Metric names stored in DailyStat.metric
+NEW_USERS = 'new_users'
+NEW_ITEMS = 'new_items'                    # key: item category
+REQUESTS_BY_STATUS = 'requests_by_status'  # key: status the request moved to
+ACCEPTANCE_LATENCY = 'acceptance_latency'  # count: accepted requests, total: seconds waited
+
+
+def _upsert(values):
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        stmt = postgresql.insert(DailyStat).values(**values)
+    elif dialect == 'sqlite':
+        stmt = sqlite.insert(DailyStat).values(**values)
+    else:  # pragma: no cover - only PostgreSQL and SQLite are deployed
+        raise RuntimeError(f"Daily stats upsert not supported on {dialect}")
+    return stmt.on_conflict_do_update(
+        index_elements=['day', 'metric', 'key'],
+        set_={
+            'count': DailyStat.count + stmt.excluded.count,
+            'total': DailyStat.total + stmt.excluded.total,
+        }
+    )
+
+
+def record_stat(metric, key='', count=1, total=0.0, day=None):
+    # Adds `count`/`total` to today's (or `day`'s) bucket. Does not commit.
+    if count == 0 and total == 0:
+        return
+    day = day or datetime.utcnow().date()
+    db.session.execute(_upsert({'day': day, 'metric': metric, 'key': key, 'count': count, 'total': total}))
+
+
+def record_status_change(new_status, requested_at_values, now=None):
+    # Records a batch of requests moving to `new_status`. For acceptances the
+    # time waited since each request was made feeds the latency rollup.
+    requested_at_values = list(requested_at_values)
+    if not requested_at_values:
+        return
+    record_stat(REQUESTS_BY_STATUS, new_status, count=len(requested_at_values))
+    if new_status == 'accepted':
+        now = now or datetime.utcnow()
+        waited = sum((now - requested_at).total_seconds() for requested_at in requested_at_values)
+        record_stat(ACCEPTANCE_LATENCY, count=len(requested_at_values), total=waited)
@@ -1,11 +1,16 @@
 # backend/views/admin.py
 # This file handles administration-related routes (e.g., managing users, all requests).
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, jsonify, request, current_app, Response, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from backend.extensions import db, bcrypt # <--- Changed: Correct import for db, bcrypt
-from backend.models import User, Item, Request, TokenBlacklist # <--- Changed: Correct import for models
-from sqlalchemy import desc # For sorting if needed, no change to import path for this
+from backend.extensions import db, bcrypt, request_cache # <--- Changed: Correct import for db, bcrypt
+from backend.models import User, Item, Request, TokenBlacklist, DailyStat, AuditEvent # <--- Changed: Correct import for models
+from backend.views.myrequest import parse_id_list
+from backend.audit import audit_log
+from backend.stats import record_stat, NEW_USERS, NEW_ITEMS, REQUESTS_BY_STATUS, ACCEPTANCE_LATENCY
+from datetime import date, datetime, timedelta
+import json
+from sqlalchemy import and_, desc, delete, or_ # For sorting if needed, no change to import path for this
 
 admin_bp = Blueprint('admin', __name__)
 
@@ -58,7 +63,10 @@ def create_admin_user():
     # User model's __init__ method now handles hashing the password
     new_admin = User(username=username, email=email, password=password, role='admin')
     db.session.add(new_admin)
+    record_stat(NEW_USERS)
     db.session.commit()
+    audit_log.record('admin.user_created', get_jwt_identity()['id'], 'user', new_admin.id,
+                     username=username, role='admin')
 
     return jsonify({"msg": "Admin user created successfully", "username": username}), 201
 
@@ -100,8 +108,190 @@ def admin_delete_request(request_id):
     if not req:
         return jsonify({"msg": "Request not found"}), 404
 
+    involved = (req.requester_id, req.item_owner_id)
+    snapshot = {"item_id": req.item_id, "requester_id": req.requester_id,
+                "item_owner_id": req.item_owner_id, "status": req.status}
     db.session.delete(req)
     db.session.commit()
+    request_cache.invalidate(*involved)
+    audit_log.record('admin.request_deleted', get_jwt_identity()['id'], 'request', request_id, **snapshot)
     return jsonify({"msg": f"Request {request_id} deleted successfully"}), 200
 
+# Route to delete many requests at once (Admin only).
+# Issues a single DELETE ... WHERE id IN (...) instead of loading each row.
+@admin_bp.route('/admin/requests/batch_delete', methods=['POST'])
+@jwt_required()
+def admin_batch_delete_requests():
+    if not admin_required():
+        return jsonify({"msg": "Admin access required"}), 403
+
+    request_ids, error = parse_id_list(request.get_json())
+    if error:
+        return jsonify({"msg": error}), 400
+
+    deleted = db.session.execute(
+        delete(Request)
+        .where(Request.id.in_(request_ids))
+        .returning(Request.id, Request.requester_id, Request.item_owner_id, Request.item_id, Request.status)
+        .execution_options(synchronize_session=False)
+    ).all()
+    db.session.commit()
+    deleted_ids = {row.id for row in deleted}
+    request_cache.invalidate(*{user_id for row in deleted for user_id in (row.requester_id, row.item_owner_id)})
+    admin_id = get_jwt_identity()['id']
+    for row in deleted:
+        audit_log.record('admin.request_deleted', admin_id, 'request', row.id,
+                         item_id=row.item_id, requester_id=row.requester_id,
+                         item_owner_id=row.item_owner_id, status=row.status, batch=True)
+
+    results = {request_id: "deleted" if request_id in deleted_ids else "not_found"
+               for request_id in request_ids}
+    return jsonify({"msg": f"{len(deleted_ids)} request(s) deleted", "results": results}), 200
+
+# Route to get daily marketplace statistics (Admin only).
+# Reads only the daily_stat rollups, so cost depends on the number of days
+# requested, never on the size of the user/item/request tables.
+@admin_bp.route('/admin/stats', methods=['GET'])
+@jwt_required()
+def admin_get_stats():
+    if not admin_required():
+        return jsonify({"msg": "Admin access required"}), 403
+
+    try:
+        end = date.fromisoformat(request.args['to']) if request.args.get('to') else datetime.utcnow().date()
+        start = date.fromisoformat(request.args['from']) if request.args.get('from') else end - timedelta(days=29)
+    except ValueError:
+        return jsonify({"msg": "from and to must be dates in YYYY-MM-DD format"}), 400
+
+    if start > end:
+        return jsonify({"msg": "from must not be after to"}), 400
+    if (end - start).days + 1 > current_app.config['STATS_MAX_DAYS']:
+        return jsonify({"msg": f"At most {current_app.config['STATS_MAX_DAYS']} days per query"}), 400
+
+    rows = DailyStat.query.filter(DailyStat.day >= start, DailyStat.day <= end) \
+        .order_by(DailyStat.day).all()
+
+    def empty_bucket():
+        return {"new_users": 0, "new_items": {}, "requests_by_status": {},
+                "accepted": 0, "acceptance_latency_seconds": 0.0}
+
+    days = {}
+    totals = empty_bucket()
+    for row in rows:
+        for bucket in (days.setdefault(row.day, empty_bucket()), totals):
+            if row.metric == NEW_USERS:
+                bucket["new_users"] += row.count
+            elif row.metric == NEW_ITEMS:
+                bucket["new_items"][row.key] = bucket["new_items"].get(row.key, 0) + row.count
+            elif row.metric == REQUESTS_BY_STATUS:
+                bucket["requests_by_status"][row.key] = bucket["requests_by_status"].get(row.key, 0) + row.count
+            elif row.metric == ACCEPTANCE_LATENCY:
+                bucket["accepted"] += row.count
+                bucket["acceptance_latency_seconds"] += row.total
+
+    def summarize(bucket):
+        accepted = bucket.pop("accepted")
+        latency = bucket.pop("acceptance_latency_seconds")
+        bucket["avg_acceptance_latency_seconds"] = round(latency / accepted, 1) if accepted else None
+        return bucket
+
+    output = []
+    for day in sorted(days):
+        output.append({"date": day.isoformat(), **summarize(days[day])})
+
+    return jsonify({
+        "from": start.isoformat(),
+        "to": end.isoformat(),
+        "days": output,
+        "totals": summarize(totals)
+    }), 200
+
+# Route to get hit/miss counters of the per-user request list cache (Admin only).
+# Counters are per worker process.
+@admin_bp.route('/admin/cache/stats', methods=['GET'])
+@jwt_required()
+def admin_get_cache_stats():
+    if not admin_required():
+        return jsonify({"msg": "Admin access required"}), 403
+    return jsonify(request_cache.stats()), 200
+
+# Route to page through the audit log, newest first (Admin only).
+# Keyset pagination on (created_at, id): pass the returned next_before and
+# next_before_id as ?before=&before_id= to get the next page. Events are
+# buffered and may be inserted out of id order, so id alone is not a stable
+# cursor. Optional filters: actor_id, from, to (ISO datetimes).
+@admin_bp.route('/admin/audit', methods=['GET'])
+@jwt_required()
+def admin_get_audit_events():
+    if not admin_required():
+        return jsonify({"msg": "Admin access required"}), 403
+
+    per_page = min(max(request.args.get('per_page', 50, type=int), 1), current_app.config['AUDIT_MAX_PER_PAGE'])
+    query = AuditEvent.query
+    try:
+        if request.args.get('from'):
+            query = query.filter(AuditEvent.created_at >= datetime.fromisoformat(request.args['from']))
+        if request.args.get('to'):
+            query = query.filter(AuditEvent.created_at <= datetime.fromisoformat(request.args['to']))
+        before = datetime.fromisoformat(request.args['before']) if request.args.get('before') else None
+    except ValueError:
+        return jsonify({"msg": "from, to and before must be ISO 8601 datetimes"}), 400
+    before_id = request.args.get('before_id', type=int)
+    if (before is None) != (before_id is None):
+        return jsonify({"msg": "before and before_id must be given together"}), 400
+    if request.args.get('actor_id', type=int) is not None:
+        query = query.filter(AuditEvent.actor_id == request.args.get('actor_id', type=int))
+    if before is not None:
+        query = query.filter(or_(
+            AuditEvent.created_at < before,
+            and_(AuditEvent.created_at == before, AuditEvent.id < before_id),
+        ))
+
+    # Make this worker's buffered events visible before reading
+    audit_log.flush()
+    events = query.order_by(AuditEvent.created_at.desc(), AuditEvent.id.desc()).limit(per_page + 1).all()
+
+    output = []
+    for event in events[:per_page]:
+        output.append({
+            "id": event.id,
+            "created_at": event.created_at.isoformat(),
+            "actor_id": event.actor_id,
+            "action": event.action,
+            "target_type": event.target_type,
+            "target_id": event.target_id,
+            "details": json.loads(event.details) if event.details else None
+        })
+    has_more = len(events) > per_page
+    return jsonify({
+        "events": output,
+        "next_before": output[-1]["created_at"] if has_more else None,
+        "next_before_id": output[-1]["id"] if has_more else None,
+    }), 200
+
+# Route to download a table as gzip-compressed CSV (Admin only).
+# Streams primary-key chunks straight from Core selects, so memory use does
+# not grow with the table. ?since=<ISO datetime> exports only newer rows.
+@admin_bp.route('/admin/export/<table>', methods=['GET'])
+@jwt_required()
+def admin_export_table(table):
+    if not admin_required():
+        return jsonify({"msg": "Admin access required"}), 403
+
+    from backend.export import EXPORT_TABLES, csv_gzip_stream, iter_chunks
+    if table not in EXPORT_TABLES:
+        return jsonify({"msg": f"Unknown table; choose one of {', '.join(EXPORT_TABLES)}"}), 404
+    try:
+        since = datetime.fromisoformat(request.args['since']) if request.args.get('since') else None
+    except ValueError:
+        return jsonify({"msg": "since must be an ISO 8601 datetime"}), 400
+
+    chunks = iter_chunks(table, since, current_app.config['EXPORT_CHUNK_SIZE'])
+    filename = f"{table}-{datetime.utcnow():%Y%m%dT%H%M%S}.csv.gz"
+    return Response(
+        stream_with_context(csv_gzip_stream(table, chunks)),
+        mimetype='application/gzip',
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
+
 # Other admin routes can be added here
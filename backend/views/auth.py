@@ -1,12 +1,17 @@
 # backend/views/auth.py
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
-from backend.extensions import db, bcrypt # <--- Changed: Import from backend.extensions
+from backend.extensions import db, bcrypt, limiter # <--- Changed: Import from backend.extensions
 from backend.models import User # <--- Changed: Import from backend.models
+from backend.stats import record_stat, NEW_USERS
+from backend.ratelimit import by_ip, by_json_field
+from backend.idempotency import idempotent
 
 auth_bp = Blueprint('auth', __name__)
 
 @auth_bp.route('/register', methods=['POST'])
+@limiter.limit('RATELIMIT_REGISTER_PER_IP', by_ip)
+@idempotent(per_user=False)
 def register():
     data = request.get_json()
     username = data.get('username')
@@ -22,11 +27,14 @@ def register():
 
     new_user = User(username=username, email=email, password=password, role='user') # User.__init__ hashes
     db.session.add(new_user)
+    record_stat(NEW_USERS)
     db.session.commit()
 
     return jsonify({"msg": "User registered successfully", "username": username}), 201
 
 @auth_bp.route('/login', methods=['POST'])
+@limiter.limit('RATELIMIT_LOGIN_PER_IP', by_ip)
+@limiter.limit('RATELIMIT_LOGIN_PER_USERNAME', by_json_field('username'))
 def login():
     data = request.get_json()
     username = data.get('username')
@@ -0,0 +1,134 @@
+# backend/views/health.py
+# Liveness and readiness probes for the load balancer.
+#
+# /health/live never touches the database: it only proves the worker can serve.
+# /health/ready reports DB reachability, connection pool usage and whether the
+# schema is at the Alembic head. The DB ping is cached for
+# HEALTH_DB_PING_TTL seconds and only one thread pings at a time, so probe
+# traffic adds at most one query per worker per interval.
+#
+# pool_status() and migration_status() are also used by the readiness probe
+# of the ASGI app (backend/asgi.py), so both report the same checks.
+
+import threading
+import time
+
+from flask import Blueprint, current_app, jsonify
+from sqlalchemy import text
+
+from backend.app import MIGRATIONS_DIR
+from backend.extensions import db
+
+health_bp = Blueprint('health', __name__)
+
+_ping_lock = threading.Lock()
+_ping_cache = {'checked_at': None, 'result': None}
+_migration_heads = None
+
+
+def _script_heads():
+    # Head revisions from the migrations directory; read once per process.
+    global _migration_heads
+    if _migration_heads is None:
+        from alembic.config import Config as AlembicConfig
+        from alembic.script import ScriptDirectory
+        alembic_cfg = AlembicConfig()
+        alembic_cfg.set_main_option('script_location', MIGRATIONS_DIR)
+        _migration_heads = set(ScriptDirectory.from_config(alembic_cfg).get_heads())
+    return _migration_heads
+
+
+def pool_status(pool):
+    if not hasattr(pool, 'checkedout'):
+        return {'class': type(pool).__name__}
+    size = pool.size()
+    max_overflow = getattr(pool, '_max_overflow', 0)
+    checked_out = pool.checkedout()
+    return {
+        'class': type(pool).__name__,
+        'size': size,
+        'max_overflow': max_overflow,
+        'checked_out': checked_out,
+        'overflow': max(pool.overflow(), 0),
+        'exhausted': max_overflow >= 0 and checked_out >= size + max_overflow,
+    }
+
+
+def migration_status(revisions):
+    # `revisions` is the set of versions in alembic_version, or None when the
+    # table is missing (schema created without migrations).
+    heads = _script_heads()
+    return {
+        'current': sorted(revisions) if revisions is not None else None,
+        'head': sorted(heads),
+        'up_to_date': revisions == heads if revisions is not None else None,
+    }
+
+
+def _ping():
+    started = time.monotonic()
+    try:
+        with db.engine.connect() as connection:
+            checkout_wait_ms = (time.monotonic() - started) * 1000
+            connection.execute(text('SELECT 1'))
+            try:
+                revisions = set(connection.execute(text('SELECT version_num FROM alembic_version')).scalars())
+            except Exception:
+                revisions = None
+                connection.rollback()
+    except Exception as exc:
+        current_app.logger.warning("Readiness DB ping failed: %s", exc)
+        return {'ok': False, 'error': type(exc).__name__}
+
+    return {
+        'ok': True,
+        'latency_ms': round((time.monotonic() - started) * 1000, 2),
+        'checkout_wait_ms': round(checkout_wait_ms, 2),
+        'migrations': migration_status(revisions),
+    }
+
+
+def cached_db_ping():
+    now = time.monotonic()
+    ttl = current_app.config['HEALTH_DB_PING_TTL']
+    checked_at = _ping_cache['checked_at']
+    if checked_at is not None and now - checked_at < ttl:
+        return _ping_cache['result'], now - checked_at
+
+    # If another thread is already pinging, serve the previous result rather
+    # than piling up a second query.
+    if not _ping_lock.acquire(blocking=_ping_cache['result'] is None):
+        return _ping_cache['result'], now - checked_at
+    try:
+        result = _ping()
+        _ping_cache['result'], _ping_cache['checked_at'] = result, time.monotonic()
+        return result, 0.0
+    finally:
+        _ping_lock.release()
+
+
+@health_bp.route('/health', methods=['GET'])
+def health_check():
+    return {'status': 'healthy'}, 200
+
+
+@health_bp.route('/health/live', methods=['GET'])
+def liveness():
+    return {'status': 'alive'}, 200
+
+
+@health_bp.route('/health/ready', methods=['GET'])
+def readiness():
+    pool = pool_status(db.engine.pool)
+    if pool.get('exhausted'):
+        # Pinging would block on pool_timeout; report unready straight away.
+        return jsonify({'status': 'unready', 'reason': 'pool_exhausted', 'pool': pool}), 503
+
+    database, age = cached_db_ping()
+    ready = database['ok'] and database['migrations']['up_to_date'] is not False
+    body = {
+        'status': 'ready' if ready else 'unready',
+        'database': {**database, 'cached_for_s': round(age, 2)},
+        'pool': pool,
+    }
+    return jsonify(body), 200 if ready else 503
@@ -3,13 +3,17 @@
 
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy import select
 from backend.extensions import db # <--- Changed: Correct import for db
 from backend.models import Item, User # <--- Changed: Correct import for Item, User
+from backend.stats import record_stat, NEW_ITEMS
+from backend.idempotency import idempotent
 
 item_bp = Blueprint('item', __name__)
 
 @item_bp.route('/items', methods=['POST'])
 @jwt_required()
+@idempotent()
 def create_item():
     current_user_identity = get_jwt_identity()
     user_id = current_user_identity['id']
@@ -33,28 +37,52 @@ def create_item():
         user_id=user_id
     )
     db.session.add(new_item)
+    record_stat(NEW_ITEMS, category)
     db.session.commit()
 
     return jsonify({"msg": "Item created successfully", "item_id": new_item.id}), 201
 
+# Helper turning ?q=&category= into filter conditions on Item.
+# Shared with the async listing in backend/asgi.py.
+def item_search_filters(args):
+    filters = []
+    q = (args.get('q') or '').strip()
+    if q:
+        pattern = f"%{q}%"
+        filters.append(Item.title.ilike(pattern) | Item.description.ilike(pattern))
+    if args.get('category'):
+        filters.append(Item.category == args.get('category'))
+    return filters
+
+# Listing query with the owner's username joined in, so a page of items is
+# one query rather than one owner lookup per item. Shared with backend/asgi.py.
+def item_listing_query(args):
+    return (
+        select(Item.id, Item.title, Item.description, Item.category, Item.image_url,
+               Item.location, Item.created_at, Item.is_available, Item.user_id,
+               User.username.label('owner_username'))
+        .outerjoin(User, User.id == Item.user_id)
+        .where(*item_search_filters(args))
+        .order_by(Item.id)
+    )
+
+def item_listing_row(row):
+    return {
+        "id": row.id,
+        "title": row.title,
+        "description": row.description,
+        "category": row.category,
+        "image_url": row.image_url,
+        "location": row.location,
+        "created_at": row.created_at.isoformat(),
+        "is_available": row.is_available,
+        "user_id": row.user_id,
+        "owner_username": row.owner_username or "Unknown"
+    }
+
 @item_bp.route('/items', methods=['GET'])
 def get_items():
-    items = Item.query.all()
-    output = []
-    for item in items:
-        owner = User.query.get(item.user_id) # Get the owner to display username
-        output.append({
-            "id": item.id,
-            "title": item.title,
-            "description": item.description,
-            "category": item.category,
-            "image_url": item.image_url,
-            "location": item.location,
-            "created_at": item.created_at.isoformat(),
-            "is_available": item.is_available,
-            "user_id": item.user_id,
-            "owner_username": owner.username if owner else "Unknown"
-        })
-    return jsonify(output), 200
+    rows = db.session.execute(item_listing_query(request.args)).all()
+    return jsonify([item_listing_row(row) for row in rows]), 200
 
 # Add other item-related routes here (e.g., PUT/PATCH for update, DELETE)
@@ -1,17 +1,85 @@
 # backend/views/myrequest.py
 # This file handles request-related routes for users (creating, viewing sent/received, updating status).
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from backend.extensions import db # <--- Changed: Correct import for db
-from backend.models import Item, User, Request # <--- Changed: Correct import for Item, User, Request
+from backend.extensions import db, request_cache # <--- Changed: Correct import for db
+from backend.models import Item, User, Request, ArchivedRequest, REQUEST_ACTIVE_STATUSES, REQUEST_FINISHED_STATUSES
 from datetime import datetime
+from sqlalchemy import select, update, union_all
+from backend.stats import record_stat, record_status_change, REQUESTS_BY_STATUS
+from backend.idempotency import idempotent
+from backend.audit import audit_log
 
 request_bp = Blueprint('request', __name__)
 
+# Statuses an item owner may move a request to
+VALID_STATUS_UPDATES = ['accepted', 'rejected', 'completed']
+
+# Helper to validate the "request_ids" list sent to the batch endpoints.
+# Returns (ids, error_message); duplicates are dropped, order is preserved.
+def parse_id_list(data):
+    ids = data.get('request_ids') if data else None
+    if not isinstance(ids, list) or not ids:
+        return None, "request_ids must be a non-empty list"
+    if not all(isinstance(i, int) and not isinstance(i, bool) for i in ids):
+        return None, "request_ids must contain only integers"
+    ids = list(dict.fromkeys(ids))
+    if len(ids) > current_app.config['BATCH_MAX_IDS']:
+        return None, f"At most {current_app.config['BATCH_MAX_IDS']} request_ids per batch"
+    return ids, None
+
+# Helper to read ?page=&per_page= for the history endpoints.
+def parse_pagination():
+    page = request.args.get('page', 1, type=int)
+    per_page = request.args.get('per_page', current_app.config['HISTORY_PER_PAGE'], type=int)
+    page = max(page, 1)
+    per_page = min(max(per_page, 1), current_app.config['HISTORY_MAX_PER_PAGE'])
+    return page, per_page
+
+# Finished requests for one user, newest first, from both the hot table
+# (not yet archived) and request_archive. `role` is 'requester' or 'item_owner'.
+def request_history(role, user_id, page, per_page):
+    live = select(
+        Request.id.label('request_id'), Request.item_id, Request.requester_id,
+        Request.item_owner_id, Request.status, Request.requested_at
+    ).where(Request.status.in_(REQUEST_FINISHED_STATUSES), getattr(Request, f'{role}_id') == user_id)
+    archived = select(
+        ArchivedRequest.id, ArchivedRequest.item_id, ArchivedRequest.requester_id,
+        ArchivedRequest.item_owner_id, ArchivedRequest.status, ArchivedRequest.requested_at
+    ).where(getattr(ArchivedRequest, f'{role}_id') == user_id)
+    history = union_all(live, archived).subquery()
+
+    # The username shown is the *other* party of the request
+    other_id = history.c.item_owner_id if role == 'requester' else history.c.requester_id
+    rows = db.session.execute(
+        select(history, Item.title, User.username)
+        .outerjoin(Item, Item.id == history.c.item_id)
+        .outerjoin(User, User.id == other_id)
+        .order_by(history.c.requested_at.desc(), history.c.request_id.desc())
+        .limit(per_page + 1)
+        .offset((page - 1) * per_page)
+    ).all()
+
+    username_key = 'item_owner_username' if role == 'requester' else 'requester_username'
+    output = []
+    for row in rows[:per_page]:
+        output.append({
+            "request_id": row.request_id,
+            "item_id": row.item_id,
+            "item_title": row.title or "Unknown Item",
+            "requester_id": row.requester_id,
+            "item_owner_id": row.item_owner_id,
+            username_key: row.username or "Unknown User",
+            "status": row.status,
+            "requested_at": row.requested_at.isoformat()
+        })
+    return {"requests": output, "page": page, "per_page": per_page, "has_more": len(rows) > per_page}
+
 # Route to create a new request for an item
 @request_bp.route('/requests', methods=['POST'])
 @jwt_required()
+@idempotent()
 def create_request():
     current_user_identity = get_jwt_identity()
     requester_id = current_user_identity['id']
@@ -47,60 +115,90 @@ def create_request():
         status='pending'
     )
     db.session.add(new_request)
+    record_stat(REQUESTS_BY_STATUS, 'pending')
     db.session.commit()
+    request_cache.invalidate(requester_id, item.user_id)
 
     return jsonify({"msg": "Request sent successfully", "request_id": new_request.id}), 201
 
-# Route to get all requests sent by the current user
+# Route to get the active (pending/accepted) requests sent by the current user.
+# Finished requests are served, paginated, by /requests/sent/history.
 @request_bp.route('/requests/sent', methods=['GET'])
 @jwt_required()
 def get_sent_requests():
     current_user_identity = get_jwt_identity()
     requester_id = current_user_identity['id']
 
-    sent_requests = Request.query.filter_by(requester_id=requester_id).all()
-    
-    output = []
-    for req in sent_requests:
-        item_title = req.item.title if req.item else "Unknown Item"
-        item_owner_username = req.item_owner.username if req.item_owner else "Unknown Owner"
-        output.append({
-            "request_id": req.id,
-            "item_id": req.item_id,
-            "item_title": item_title,
-            "requester_id": req.requester_id,
-            "item_owner_id": req.item_owner_id,
-            "item_owner_username": item_owner_username,
-            "status": req.status,
-            "requested_at": req.requested_at.isoformat()
-        })
-    return jsonify(output), 200
+    def build():
+        sent_requests = Request.query.filter_by(requester_id=requester_id) \
+            .filter(Request.status.in_(REQUEST_ACTIVE_STATUSES)).all()
+
+        output = []
+        for req in sent_requests:
+            item_title = req.item.title if req.item else "Unknown Item"
+            item_owner_username = req.item_owner.username if req.item_owner else "Unknown Owner"
+            output.append({
+                "request_id": req.id,
+                "item_id": req.item_id,
+                "item_title": item_title,
+                "requester_id": req.requester_id,
+                "item_owner_id": req.item_owner_id,
+                "item_owner_username": item_owner_username,
+                "status": req.status,
+                "requested_at": req.requested_at.isoformat()
+            })
+        return output
 
-# Route to get all requests received by the current user (for their items)
+    # Served from the per-user cache; see backend/request_cache.py
+    return jsonify(request_cache.get_or_build(requester_id, 'sent', build)), 200
+
+# Route to get the active requests received by the current user (for their items).
+# Finished requests are served, paginated, by /requests/received/history.
 @request_bp.route('/requests/received', methods=['GET'])
 @jwt_required()
 def get_received_requests():
     current_user_identity = get_jwt_identity()
     item_owner_id = current_user_identity['id']
 
-    # Filter requests where the current user is the item owner
-    received_requests = Request.query.filter_by(item_owner_id=item_owner_id).all()
-    
-    output = []
-    for req in received_requests:
-        item_title = req.item.title if req.item else "Unknown Item"
-        requester_username = req.requester.username if req.requester else "Unknown Requester"
-        output.append({
-            "request_id": req.id,
-            "item_id": req.item_id,
-            "item_title": item_title,
-            "requester_id": req.requester_id,
-            "requester_username": requester_username,
-            "item_owner_id": req.item_owner_id,
-            "status": req.status,
-            "requested_at": req.requested_at.isoformat()
-        })
-    return jsonify(output), 200
+    def build():
+        # Filter requests where the current user is the item owner
+        received_requests = Request.query.filter_by(item_owner_id=item_owner_id) \
+            .filter(Request.status.in_(REQUEST_ACTIVE_STATUSES)).all()
+
+        output = []
+        for req in received_requests:
+            item_title = req.item.title if req.item else "Unknown Item"
+            requester_username = req.requester.username if req.requester else "Unknown Requester"
+            output.append({
+                "request_id": req.id,
+                "item_id": req.item_id,
+                "item_title": item_title,
+                "requester_id": req.requester_id,
+                "requester_username": requester_username,
+                "item_owner_id": req.item_owner_id,
+                "status": req.status,
+                "requested_at": req.requested_at.isoformat()
+            })
+        return output
+
+    # Served from the per-user cache; see backend/request_cache.py
+    return jsonify(request_cache.get_or_build(item_owner_id, 'received', build)), 200
+
+# Route to page through finished requests sent by the current user
+@request_bp.route('/requests/sent/history', methods=['GET'])
+@jwt_required()
+def get_sent_request_history():
+    current_user_identity = get_jwt_identity()
+    page, per_page = parse_pagination()
+    return jsonify(request_history('requester', current_user_identity['id'], page, per_page)), 200
+
+# Route to page through finished requests received by the current user
+@request_bp.route('/requests/received/history', methods=['GET'])
+@jwt_required()
+def get_received_request_history():
+    current_user_identity = get_jwt_identity()
+    page, per_page = parse_pagination()
+    return jsonify(request_history('item_owner', current_user_identity['id'], page, per_page)), 200
 
 # Route to update the status of a request (by the item owner)
 @request_bp.route('/requests/<int:request_id>/status', methods=['PUT'])
@@ -112,7 +210,7 @@ def update_request_status(request_id):
     data = request.get_json()
     new_status = data.get('status')
 
-    if new_status not in ['accepted', 'rejected', 'completed']:
+    if new_status not in VALID_STATUS_UPDATES:
         return jsonify({"msg": "Invalid status provided"}), 400
 
     req = Request.query.get(request_id)
@@ -123,9 +221,77 @@ def update_request_status(request_id):
     if req.item_owner_id != user_id:
         return jsonify({"msg": "You are not authorized to update this request"}), 403
 
+    old_status = req.status
+    if old_status != new_status:
+        record_status_change(new_status, [req.requested_at])
     req.status = new_status
     db.session.commit()
+    request_cache.invalidate(req.requester_id, req.item_owner_id)
+    audit_log.record('request.status_changed', user_id, 'request', request_id,
+                     old_status=old_status, new_status=new_status)
 
 
 
     return jsonify({"msg": f"Request {request_id} status updated to {new_status}"}), 200
+
+# Route to update the status of many requests at once (by the item owner).
+# A single UPDATE ... WHERE id IN (...) AND item_owner_id = <current user> is
+# issued, so rows the caller does not own are never touched or loaded.
+@request_bp.route('/requests/status', methods=['PUT'])
+@jwt_required()
+def batch_update_request_status():
+    current_user_identity = get_jwt_identity()
+    user_id = current_user_identity['id']
+
+    data = request.get_json()
+    request_ids, error = parse_id_list(data)
+    if error:
+        return jsonify({"msg": error}), 400
+
+    new_status = data.get('status')
+    if new_status not in VALID_STATUS_UPDATES:
+        return jsonify({"msg": "Invalid status provided"}), 400
+
+    # Rows already in the target status are left alone so the daily stats
+    # only count real transitions.
+    updated = db.session.execute(
+        update(Request)
+        .where(Request.id.in_(request_ids), Request.item_owner_id == user_id,
+               Request.status != new_status)
+        .values(status=new_status)
+        .returning(Request.id, Request.requested_at, Request.requester_id)
+        .execution_options(synchronize_session=False)
+    ).all()
+    updated_ids = {row.id for row in updated}
+    record_status_change(new_status, [row.requested_at for row in updated])
+
+    # Anything not updated doesn't exist, belongs to someone else or is unchanged
+    remaining = [i for i in request_ids if i not in updated_ids]
+    owners = {}
+    if remaining:
+        owners = dict(db.session.execute(
+            select(Request.id, Request.item_owner_id).where(Request.id.in_(remaining))
+        ).all())
+    db.session.commit()
+    if updated:
+        request_cache.invalidate(user_id, *{row.requester_id for row in updated})
+    for row in updated:
+        audit_log.record('request.status_changed', user_id, 'request', row.id,
+                         new_status=new_status, batch=True)
+
+    results = {}
+    for request_id in request_ids:
+        if request_id in updated_ids:
+            results[request_id] = "updated"
+        elif request_id not in owners:
+            results[request_id] = "not_found"
+        elif owners[request_id] == user_id:
+            results[request_id] = "unchanged"
+        else:
+            results[request_id] = "forbidden"
+
+    return jsonify({
+        "msg": f"{len(updated_ids)} request(s) updated to {new_status}",
+        "status": new_status,
+        "results": results
+    }), 200
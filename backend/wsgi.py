@@ -0,0 +1,7 @@
+# backend/wsgi.py
+# WSGI entry point for gunicorn: `gunicorn -c backend/gunicorn.conf.py backend.wsgi:app`.
+# Serving workers skip Flask-Migrate/Alembic; migrations run through the flask CLI.
+
+from backend.app import create_app
+
+app = create_app(with_migrations=False)
@@ -0,0 +1,106 @@
+# benchmarks/concurrency.py
+# Compares how much concurrent GET /api/items traffic one process can serve
+# through the WSGI app (gunicorn, one sync worker) and the ASGI app
+# (uvicorn, one worker).
+#
+#     python benchmarks/concurrency.py --concurrency 1 8 32 64 --duration 5
+#
+# Both servers are started against the database configured in the
+# environment (DATABASE_URL / .env), so seed it with representative data
+# first. For each concurrency level the script reports requests/second and
+# p50/p95 latency.
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SERVERS = {
+    'wsgi': [sys.executable, '-m', 'gunicorn', '--workers', '1', '--bind', '127.0.0.1:{port}', 'backend.wsgi:app'],
+    'asgi': [sys.executable, '-m', 'uvicorn', '--workers', '1', '--port', '{port}', '--log-level', 'warning',
+             'backend.asgi:app'],
+}
+
+
+def wait_until_up(base_url, timeout=20):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"{base_url}/health/live", timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server at {base_url} did not start")
+
+
+def run_level(url, concurrency, duration):
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+    stop_at = time.monotonic() + duration
+
+    def client():
+        nonlocal errors
+        local, local_errors = [], 0
+        while time.monotonic() < stop_at:
+            started = time.monotonic()
+            try:
+                urllib.request.urlopen(url, timeout=30).read()
+                local.append(time.monotonic() - started)
+            except OSError:
+                local_errors += 1
+        with lock:
+            latencies.extend(local)
+            errors += local_errors
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if not latencies:
+        return {'rps': 0.0, 'p50_ms': None, 'p95_ms': None, 'errors': errors}
+    latencies.sort()
+    return {
+        'rps': len(latencies) / duration,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p95_ms': latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        'errors': errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='WSGI vs ASGI concurrency per process for GET /api/items.')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32, 64])
+    parser.add_argument('--duration', type=float, default=5.0, help='Seconds per concurrency level.')
+    parser.add_argument('--path', default='/api/items')
+    parser.add_argument('--port', type=int, default=8701)
+    args = parser.parse_args()
+
+    print(f"{'server':<6} {'conc':>5} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'errors':>7}")
+    for offset, (name, command) in enumerate(SERVERS.items()):
+        port = args.port + offset
+        base_url = f"http://127.0.0.1:{port}"
+        server = subprocess.Popen([part.format(port=port) for part in command], cwd=ROOT,
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            wait_until_up(base_url)
+            for concurrency in args.concurrency:
+                result = run_level(base_url + args.path, concurrency, args.duration)
+                p50 = f"{result['p50_ms']:.1f}" if result['p50_ms'] is not None else '-'
+                p95 = f"{result['p95_ms']:.1f}" if result['p95_ms'] is not None else '-'
+                print(f"{name:<6} {concurrency:>5} {result['rps']:>9.1f} {p50:>9} {p95:>9} {result['errors']:>7}")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == '__main__':
+    main()
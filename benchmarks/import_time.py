@@ -0,0 +1,68 @@
+# benchmarks/import_time.py
+# Import-time benchmark for the backend, based on `python -X importtime`.
+#
+#     python benchmarks/import_time.py                 # report backend.app, backend.wsgi
+#     python benchmarks/import_time.py --budget-ms 900 # exit 1 if any target is over
+#
+# Each target is imported in a fresh interpreter, several times, and the best
+# cumulative import time is compared with the budget. Run it in CI to catch
+# heavy imports creeping back into the startup path.
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# target module -> budget in milliseconds (cumulative, best of N runs)
+DEFAULT_BUDGETS = {
+    'backend.app': 300,
+    'backend.manage': 300,
+    'backend.wsgi': 1000,
+}
+
+LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)')
+
+
+def measure(module):
+    # Returns ({module: cumulative_us}, top-level cumulative in ms)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{result.stderr}")
+    cumulative = {}
+    for match in LINE.finditer(result.stderr):
+        cumulative[match.group(4)] = int(match.group(2))
+    return cumulative, cumulative.get(module, 0) / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import-time benchmark for the backend.')
+    parser.add_argument('modules', nargs='*', default=list(DEFAULT_BUDGETS))
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=None,
+                        help='Override the per-module budget for every target.')
+    parser.add_argument('--top', type=int, default=5, help='Show the N slowest imports per target.')
+    args = parser.parse_args()
+
+    over_budget = False
+    for module in args.modules:
+        measure(module)  # warm the bytecode cache
+        runs = [measure(module) for _ in range(args.runs)]
+        cumulative, best_ms = min(runs, key=lambda run: run[1])
+        budget = args.budget_ms if args.budget_ms is not None else DEFAULT_BUDGETS.get(module)
+        status = 'ok' if budget is None or best_ms <= budget else 'OVER BUDGET'
+        over_budget |= status != 'ok'
+        print(f"{module}: {best_ms:.1f} ms (budget {budget} ms) {status}")
+        slowest = sorted(((us, name) for name, us in cumulative.items() if name != module), reverse=True)
+        for us, name in slowest[:args.top]:
+            print(f"    {us / 1000:8.1f} ms  {name}")
+    return 1 if over_budget else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
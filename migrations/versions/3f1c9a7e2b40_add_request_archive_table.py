@@ -0,0 +1,62 @@
+"""Add request_archive table and request owner/requester indexes
+
+Revision ID: 3f1c9a7e2b40
+Revises: ad990552c6a5
+Create Date: 2026-10-19 10:12:31.482113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c9a7e2b40'
+down_revision = 'ad990552c6a5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        # Range-partitioned by requested_at; monthly partitions are created on
+        # demand by `flask archive-requests` (backend/archive.py).
+        op.execute("""
+            CREATE TABLE request_archive (
+                id INTEGER NOT NULL,
+                requested_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+                item_id INTEGER NOT NULL,
+                requester_id INTEGER NOT NULL,
+                item_owner_id INTEGER NOT NULL,
+                status VARCHAR(20) NOT NULL,
+                archived_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+                PRIMARY KEY (id, requested_at)
+            ) PARTITION BY RANGE (requested_at)
+        """)
+    else:
+        op.create_table('request_archive',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('requested_at', sa.DateTime(), nullable=False),
+        sa.Column('item_id', sa.Integer(), nullable=False),
+        sa.Column('requester_id', sa.Integer(), nullable=False),
+        sa.Column('item_owner_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('archived_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id', 'requested_at')
+        )
+    op.create_index('ix_request_archive_requester_requested_at', 'request_archive', ['requester_id', 'requested_at'], unique=False)
+    op.create_index('ix_request_archive_owner_requested_at', 'request_archive', ['item_owner_id', 'requested_at'], unique=False)
+
+    with op.batch_alter_table('request', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_request_requester_id'), ['requester_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_request_item_owner_id'), ['item_owner_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('request', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_request_item_owner_id'))
+        batch_op.drop_index(batch_op.f('ix_request_requester_id'))
+
+    op.drop_index('ix_request_archive_owner_requested_at', table_name='request_archive')
+    op.drop_index('ix_request_archive_requester_requested_at', table_name='request_archive')
+    op.drop_table('request_archive')
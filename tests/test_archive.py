@@ -0,0 +1,79 @@
+# tests/test_archive.py
+
+from datetime import datetime, timedelta
+
+from backend.archive import archive_finished_requests
+from backend.extensions import db
+from backend.models import ArchivedRequest, Request
+
+
+def test_only_old_finished_requests_are_moved(app, make_user, make_item, make_request):
+    owner, requester = make_user('owner'), make_user('requester')
+    item = make_item(owner)
+    old = datetime.utcnow() - timedelta(days=200)
+    done = [make_request(item, requester, status=status, requested_at=old + timedelta(hours=n))
+            for n, status in enumerate(['completed', 'rejected', 'completed'])]
+    still_open = make_request(item, requester, status='accepted', requested_at=old)
+    recent = make_request(item, requester, status='completed')
+
+    with app.app_context():
+        moved = archive_finished_requests(datetime.utcnow() - timedelta(days=90), batch_size=2)
+        assert moved == 3
+        assert sorted(db.session.scalars(db.select(Request.id))) == [still_open, recent]
+        archived = db.session.scalars(db.select(ArchivedRequest).order_by(ArchivedRequest.id)).all()
+        assert [row.id for row in archived] == done
+        assert all(row.archived_at is not None for row in archived)
+
+
+def test_request_reopened_mid_batch_stays_live(app, make_user, make_item, make_request, monkeypatch):
+    import backend.archive
+
+    owner, requester = make_user('owner'), make_user('requester')
+    item = make_item(owner)
+    old = datetime.utcnow() - timedelta(days=200)
+    reopened = make_request(item, requester, status='completed', requested_at=old)
+    done = make_request(item, requester, status='rejected', requested_at=old)
+
+    def reopen(start, end):
+        # Runs after the batch's ids are picked, before they are copied
+        db.session.execute(db.update(Request).where(Request.id == reopened).values(status='accepted'))
+
+    monkeypatch.setattr(backend.archive, 'ensure_archive_partitions', reopen)
+    with app.app_context():
+        assert archive_finished_requests(datetime.utcnow() - timedelta(days=90)) == 1
+        assert db.session.get(Request, reopened).status == 'accepted'
+        assert list(db.session.scalars(db.select(ArchivedRequest.id))) == [done]
+
+
+def test_history_merges_live_and_archived_rows(app, client, make_user, make_item, make_request, auth_headers):
+    owner, requester = make_user('owner'), make_user('requester')
+    item = make_item(owner, title='Tent')
+    now = datetime.utcnow()
+    make_request(item, requester, status='completed', requested_at=now - timedelta(days=300))
+    make_request(item, requester, status='rejected', requested_at=now - timedelta(days=200))
+    with app.app_context():
+        archive_finished_requests(now - timedelta(days=90))
+    make_request(item, requester, status='completed', requested_at=now - timedelta(days=1))
+    make_request(item, requester, status='pending', requested_at=now)
+
+    first = client.get('/api/requests/sent/history?per_page=2', headers=auth_headers(requester)).json
+    second = client.get('/api/requests/sent/history?per_page=2&page=2', headers=auth_headers(requester)).json
+    assert [row['status'] for row in first['requests']] == ['completed', 'rejected']
+    assert first['has_more'] is True
+    assert [row['status'] for row in second['requests']] == ['completed']
+    assert second['has_more'] is False
+    assert second['requests'][0]['item_title'] == 'Tent'
+    assert second['requests'][0]['item_owner_username'] == 'owner'
+
+    received = client.get('/api/requests/received/history', headers=auth_headers(owner)).json
+    assert len(received['requests']) == 3
+    assert received['requests'][0]['requester_username'] == 'requester'
+
+
+def test_archive_requests_command(app, make_user, make_item, make_request):
+    owner = make_user('owner')
+    make_request(make_item(owner), make_user('requester'), status='completed',
+                 requested_at=datetime.utcnow() - timedelta(days=40))
+    result = app.test_cli_runner().invoke(args=['archive-requests', '--older-than', '30'])
+    assert result.exit_code == 0
+    assert result.output.startswith('Archived 1 request(s)')
@@ -0,0 +1,62 @@
+# tests/test_asgi.py
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+pytest.importorskip('httpx')  # required by Starlette's TestClient
+from starlette.testclient import TestClient  # noqa: E402
+
+from backend import asgi  # noqa: E402
+from backend.extensions import db  # noqa: E402
+
+
+@pytest.fixture
+def asgi_client(app, monkeypatch):
+    # Same SQLite file the Flask `app` fixture created
+    uri = app.config['SQLALCHEMY_DATABASE_URI'].replace('sqlite://', 'sqlite+aiosqlite://', 1)
+    monkeypatch.setattr(asgi, 'create_engine', lambda: create_async_engine(uri))
+    monkeypatch.setattr(asgi, '_ping_cache', {'checked_at': None, 'result': None})
+    with TestClient(asgi.app) as client:
+        yield client
+
+
+def test_async_database_uri_swaps_drivers():
+    assert asgi.async_database_uri('postgresql://u:p@db/app') == 'postgresql+asyncpg://u:p@db/app'
+    assert asgi.async_database_uri('sqlite:///instance/site.db').startswith('sqlite+aiosqlite:///')
+
+
+def test_items_match_the_flask_listing(client, asgi_client, make_user, make_item):
+    owner = make_user('owner')
+    make_item(owner, title='Lamp', category='Home')
+    make_item(owner, title='Tent', category='Outdoors')
+
+    assert asgi_client.get('/api/items').json() == client.get('/api/items').json
+    searched = asgi_client.get('/api/items', params={'category': 'Outdoors'}).json()
+    assert [item['title'] for item in searched] == ['Tent']
+    assert searched[0]['owner_username'] == 'owner'
+
+
+def test_health_probes(asgi_client):
+    assert asgi_client.get('/health/live').json() == {'status': 'alive'}
+    response = asgi_client.get('/health/ready')
+    assert response.status_code == 200
+    assert response.json()['database']['ok'] is True
+
+
+def test_readiness_checks_migrations_like_the_flask_probe(app, asgi_client):
+    with app.app_context():
+        db.session.execute(text('CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)'))
+        db.session.execute(text("INSERT INTO alembic_version VALUES ('ad990552c6a5')"))
+        db.session.commit()
+    response = asgi_client.get('/health/ready')
+    assert response.status_code == 503
+    assert response.json()['database']['migrations']['up_to_date'] is False
+
+
+def test_readiness_short_circuits_on_exhausted_pool(asgi_client, monkeypatch):
+    monkeypatch.setattr(asgi, 'pool_status', lambda pool: {'class': 'QueuePool', 'exhausted': True})
+    monkeypatch.setattr(asgi, '_ping', lambda: pytest.fail('pinged with an exhausted pool'))
+    response = asgi_client.get('/health/ready')
+    assert response.status_code == 503
+    assert response.json()['reason'] == 'pool_exhausted'
@@ -0,0 +1,116 @@
+# tests/test_audit.py
+
+import json
+import os
+from datetime import datetime, timedelta
+
+from backend.audit import audit_log
+from backend.extensions import db
+from backend.models import AuditEvent
+
+
+def _spool_line(action, created_at=None):
+    return json.dumps({'created_at': (created_at or datetime.utcnow()).isoformat(), 'actor_id': 1,
+                       'action': action, 'target_type': None, 'target_id': None, 'details': None}) + '\n'
+
+
+def _actions(app):
+    with app.app_context():
+        return sorted(db.session.scalars(db.select(AuditEvent.action)))
+
+
+def test_flush_inserts_buffered_events(app):
+    audit_log.record('test.one', 1, 'item', 5, note='x')
+    audit_log.record('test.two', 1)
+    audit_log.flush()
+    assert _actions(app) == ['test.one', 'test.two']
+
+
+def test_torn_spool_line_is_quarantined(app):
+    spool = app.config['AUDIT_SPOOL_PATH']
+    with open(spool, 'w') as f:
+        f.write(_spool_line('spooled.ok') + '{"created_at": "2024-01-01T00:0')
+    audit_log.record('buffered.ok')
+    audit_log.flush()
+
+    assert _actions(app) == ['buffered.ok', 'spooled.ok']
+    assert not os.path.exists(spool) and not os.path.exists(f"{spool}.{os.getpid()}")
+    with open(f"{spool}.bad") as bad:
+        assert bad.read().startswith('{"created_at": "2024-01-01T00:0')
+
+
+def test_orphaned_claim_file_is_replayed(app):
+    spool = app.config['AUDIT_SPOOL_PATH']
+    dead_pid = 2 ** 22 + 12345  # above the default pid_max, so never alive
+    with open(f"{spool}.{dead_pid}", 'w') as f:
+        f.write(_spool_line('orphaned'))
+    audit_log.flush()
+    assert _actions(app) == ['orphaned']
+    assert not os.path.exists(f"{spool}.{dead_pid}")
+
+
+def test_events_kept_when_db_and_spool_both_fail(app, monkeypatch):
+    def broken(*args, **kwargs):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(audit_log, '_write_spool', broken)
+    with app.app_context():
+        monkeypatch.setattr(db.engine, 'begin', broken)
+        audit_log.record('kept')
+        assert audit_log.flush() == 0
+    assert [event['action'] for event in audit_log._buffer] == ['kept']
+
+    monkeypatch.undo()
+    audit_log.flush()
+    assert _actions(app) == ['kept']
+
+
+def test_buffer_is_capped(app, monkeypatch):
+    monkeypatch.setitem(app.config, 'AUDIT_MAX_BUFFER', 3)
+    monkeypatch.setitem(app.config, 'AUDIT_FLUSH_SIZE', 100)
+    for n in range(5):
+        audit_log.record(f'event.{n}')
+    assert [event['action'] for event in audit_log._buffer] == ['event.2', 'event.3', 'event.4']
+    assert audit_log.dropped == 2
+    audit_log.flush()
+    assert audit_log.dropped == 0
+
+
+def test_audit_pages_by_created_at_then_id(app, client, make_user, auth_headers):
+    admin = make_user('admin', role='admin')
+    base = datetime(2024, 5, 1, 12, 0, 0)
+    with app.app_context():
+        # Inserted out of time order, as spooled replays would be
+        db.session.add_all([
+            AuditEvent(action='third', created_at=base + timedelta(minutes=2)),
+            AuditEvent(action='first', created_at=base),
+            AuditEvent(action='second.a', created_at=base + timedelta(minutes=1)),
+            AuditEvent(action='second.b', created_at=base + timedelta(minutes=1)),
+        ])
+        db.session.commit()
+    headers = auth_headers(admin, role='admin')
+
+    seen, params = [], {'per_page': 2}
+    while True:
+        body = client.get('/api/admin/audit', query_string=params, headers=headers).json
+        seen += [event['action'] for event in body['events']]
+        if body['next_before_id'] is None:
+            break
+        params = {'per_page': 2, 'before': body['next_before'], 'before_id': body['next_before_id']}
+    assert seen == ['third', 'second.b', 'second.a', 'first']
+
+    response = client.get('/api/admin/audit', query_string={'before_id': 3}, headers=headers)
+    assert response.status_code == 400
+
+
+def test_exit_flush_is_registered_once(app, monkeypatch):
+    import atexit
+
+    from backend.audit import AuditLog
+
+    registered = []
+    monkeypatch.setattr(atexit, 'register', registered.append)
+    log = AuditLog()
+    log.init_app(app)
+    log.init_app(app)
+    assert registered == [log.flush]
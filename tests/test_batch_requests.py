@@ -0,0 +1,51 @@
+# tests/test_batch_requests.py
+
+from backend.extensions import db
+from backend.models import Request
+
+
+def _statuses(app):
+    with app.app_context():
+        return dict(db.session.execute(db.select(Request.id, Request.status)).all())
+
+
+def test_batch_status_update_reports_each_id(app, client, make_user, make_item, make_request, auth_headers):
+    owner, other, requester = make_user('owner'), make_user('other'), make_user('requester')
+    mine = make_request(make_item(owner), requester)
+    already = make_request(make_item(owner), requester, status='accepted')
+    theirs = make_request(make_item(other), requester)
+
+    response = client.put('/api/requests/status', headers=auth_headers(owner),
+                          json={'request_ids': [mine, already, theirs, 999, mine], 'status': 'accepted'})
+
+    assert response.status_code == 200
+    assert response.json['results'] == {str(mine): 'updated', str(already): 'unchanged',
+                                        str(theirs): 'forbidden', '999': 'not_found'}
+    assert _statuses(app) == {mine: 'accepted', already: 'accepted', theirs: 'pending'}
+
+
+def test_batch_status_update_validates_input(app, client, make_user, auth_headers):
+    headers = auth_headers(make_user('owner'))
+    app.config['BATCH_MAX_IDS'] = 2
+    for body in ({'request_ids': [], 'status': 'accepted'},
+                 {'request_ids': [1, 'two'], 'status': 'accepted'},
+                 {'request_ids': [1, 2, 3], 'status': 'accepted'},
+                 {'request_ids': [1], 'status': 'pending'}):
+        assert client.put('/api/requests/status', json=body, headers=headers).status_code == 400
+
+
+def test_admin_batch_delete(app, client, make_user, make_item, make_request, auth_headers):
+    admin, owner = make_user('admin', role='admin'), make_user('owner')
+    item = make_item(owner)
+    first, second = make_request(item, admin), make_request(item, admin)
+
+    response = client.post('/api/admin/requests/batch_delete', headers=auth_headers(admin, role='admin'),
+                           json={'request_ids': [first, 999]})
+    assert response.status_code == 200
+    assert response.json['results'] == {str(first): 'deleted', '999': 'not_found'}
+    assert _statuses(app) == {second: 'pending'}
+
+    denied = client.post('/api/admin/requests/batch_delete', headers=auth_headers(owner),
+                         json={'request_ids': [second]})
+    assert denied.status_code == 403
+    assert _statuses(app) == {second: 'pending'}
@@ -0,0 +1,55 @@
+# tests/test_compression.py
+
+import gzip
+
+from backend.compression import CompressedBodyCache
+from backend.extensions import compress
+
+
+def _many_items(make_user, make_item, count=30):
+    owner = make_user('owner')
+    for n in range(count):
+        make_item(owner, title=f'Item {n}')
+
+
+def test_large_listing_is_gzipped(client, make_user, make_item):
+    _many_items(make_user, make_item)
+    plain = client.get('/api/items')
+    response = client.get('/api/items', headers={'Accept-Encoding': 'gzip'})
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert int(response.headers['Content-Length']) == len(response.data) < len(plain.data)
+    assert gzip.decompress(response.data) == plain.data
+    assert 'Content-Encoding' not in plain.headers
+
+
+def test_small_and_error_responses_are_not_compressed(client):
+    small = client.get('/api/items', headers={'Accept-Encoding': 'gzip'})
+    assert small.json == [] and 'Content-Encoding' not in small.headers
+    assert 'Accept-Encoding' in small.headers['Vary']
+
+    missing = client.get('/api/nope', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in missing.headers
+
+
+def test_repeated_get_reuses_compressed_body(client, make_user, make_item):
+    _many_items(make_user, make_item)
+    compress.cache.clear()
+    first = client.get('/api/items', headers={'Accept-Encoding': 'gzip'})
+    assert len(compress.cache._entries) == 1
+    second = client.get('/api/items', headers={'Accept-Encoding': 'gzip'})
+    assert second.data == first.data
+    assert len(compress.cache._entries) == 1
+
+
+def test_body_cache_is_bounded_by_bytes():
+    cache = CompressedBodyCache(max_bytes=10)
+    cache.set('a', b'12345')
+    cache.set('b', b'12345')
+    cache.get('a')
+    cache.set('c', b'123')
+    assert cache.get('b') is None
+    assert cache.get('a') == b'12345' and cache.get('c') == b'123'
+    cache.set('huge', b'x' * 11)
+    assert cache.get('huge') is None
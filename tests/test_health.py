@@ -0,0 +1,52 @@
+# tests/test_health.py
+
+import pytest
+from sqlalchemy import text
+
+from backend.extensions import db
+from backend.views import health
+
+
+@pytest.fixture(autouse=True)
+def fresh_ping_cache(monkeypatch):
+    monkeypatch.setattr(health, '_ping_cache', {'checked_at': None, 'result': None})
+
+
+def test_liveness_and_readiness(client):
+    assert client.get('/health/live').json == {'status': 'alive'}
+
+    response = client.get('/health/ready')
+    assert response.status_code == 200
+    assert response.json['status'] == 'ready'
+    assert response.json['database']['ok'] is True
+    assert response.json['database']['migrations']['current'] is None  # schema from create_all
+
+
+def test_db_ping_is_cached(app, client, monkeypatch):
+    client.get('/health/ready')
+    monkeypatch.setattr(health, '_ping', lambda: pytest.fail('pinged again within the TTL'))
+    assert client.get('/health/ready').status_code == 200
+
+    app.config['HEALTH_DB_PING_TTL'] = 0
+    monkeypatch.setattr(health, '_ping', lambda: {'ok': False, 'error': 'OperationalError'})
+    response = client.get('/health/ready')
+    assert response.status_code == 503
+    assert response.json['database'] == {'ok': False, 'error': 'OperationalError', 'cached_for_s': 0.0}
+
+
+def test_unready_when_schema_is_behind(app, client):
+    with app.app_context():
+        db.session.execute(text('CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)'))
+        db.session.execute(text("INSERT INTO alembic_version VALUES ('ad990552c6a5')"))
+        db.session.commit()
+    response = client.get('/health/ready')
+    assert response.status_code == 503
+    assert response.json['database']['migrations']['up_to_date'] is False
+
+
+def test_unready_without_pinging_when_pool_is_exhausted(client, monkeypatch):
+    monkeypatch.setattr(health, 'pool_status', lambda pool: {'class': 'QueuePool', 'exhausted': True})
+    monkeypatch.setattr(health, '_ping', lambda: pytest.fail('pinged with an exhausted pool'))
+    response = client.get('/health/ready')
+    assert response.status_code == 503
+    assert response.json['reason'] == 'pool_exhausted'
@@ -0,0 +1,113 @@
+# tests/test_idempotency.py
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.extensions import db
+from backend.models import IdempotencyKey, Item
+
+
+def _item_count(app):
+    with app.app_context():
+        return db.session.query(Item).count()
+
+
+def test_retry_replays_stored_response(app, client, make_user, auth_headers):
+    headers = {**auth_headers(make_user('alice')), 'Idempotency-Key': 'k1'}
+    body = {'title': 'Lamp', 'description': 'A lamp', 'category': 'Home'}
+
+    first = client.post('/api/items', json=body, headers=headers)
+    retry = client.post('/api/items', json=body, headers=headers)
+    assert first.status_code == retry.status_code == 201
+    assert retry.json == first.json
+    assert retry.headers['Idempotent-Replayed'] == 'true'
+    assert _item_count(app) == 1
+
+    other = client.post('/api/items', json={**body, 'title': 'Desk'}, headers=headers)
+    assert other.status_code == 422
+
+
+def _reserve(app, scope, key, locked_until):
+    # Puts a finished key back in the state of a reservation whose worker
+    # died before the view committed anything
+    with app.app_context():
+        record = IdempotencyKey.query.filter_by(scope=scope, key=key).one()
+        record.status_code, record.response_body, record.locked_until = None, None, locked_until
+        record.view_committed = False
+        db.session.commit()
+
+
+def test_stale_reservation_is_taken_over(app, client, make_user, auth_headers):
+    user_id = make_user('alice')
+    headers = {**auth_headers(user_id), 'Idempotency-Key': 'k2'}
+    body = {'title': 'Lamp', 'description': 'A lamp', 'category': 'Home'}
+    client.post('/api/items', json=body, headers=headers)
+    scope = f'item.create_item:{user_id}'
+
+    # Worker still running the view: retries wait
+    _reserve(app, scope, 'k2', datetime.utcnow() + timedelta(seconds=30))
+    busy = client.post('/api/items', json=body, headers=headers)
+    assert busy.status_code == 409
+    assert 1 <= int(busy.headers['Retry-After']) <= 30
+
+    # Worker died: once the lock lapses the retry runs the view again
+    _reserve(app, scope, 'k2', datetime.utcnow() - timedelta(seconds=1))
+    retry = client.post('/api/items', json=body, headers=headers)
+    assert retry.status_code == 201
+    assert 'Idempotent-Replayed' not in retry.headers
+    with app.app_context():
+        record = IdempotencyKey.query.filter_by(scope=scope, key='k2').one()
+        assert record.status_code == 201 and record.locked_until is None
+
+
+class WorkerDied(BaseException):
+    pass
+
+
+def test_no_second_write_when_worker_dies_after_the_views_commit(app, client, make_user, auth_headers,
+                                                                   monkeypatch):
+    import backend.views.item
+
+    user_id = make_user('alice')
+    headers = {**auth_headers(user_id), 'Idempotency-Key': 'k3'}
+    body = {'title': 'Lamp', 'description': 'A lamp', 'category': 'Home'}
+
+    def die(*args, **kwargs):
+        raise WorkerDied()
+
+    # create_item has committed the item when it builds its response
+    monkeypatch.setattr(backend.views.item, 'jsonify', die)
+    with pytest.raises(WorkerDied):
+        client.post('/api/items', json=body, headers=headers)
+    monkeypatch.undo()
+    assert _item_count(app) == 1
+
+    with app.app_context():
+        record = IdempotencyKey.query.filter_by(scope=f'item.create_item:{user_id}', key='k3').one()
+        assert record.view_committed is True and record.status_code is None
+        record.locked_until = datetime.utcnow() - timedelta(seconds=1)
+        db.session.commit()
+
+    retry = client.post('/api/items', json=body, headers=headers)
+    assert retry.status_code == 409
+    assert 'already processed' in retry.json['msg']
+    assert _item_count(app) == 1
+
+
+def test_view_that_commits_nothing_is_not_flagged(app, client, make_user, auth_headers):
+    headers = {**auth_headers(make_user('alice')), 'Idempotency-Key': 'k4'}
+    assert client.post('/api/items', json={'title': 'Lamp'}, headers=headers).status_code == 400
+    with app.app_context():
+        record = IdempotencyKey.query.filter_by(key='k4').one()
+        assert record.status_code == 400 and record.view_committed is False
+
+
+def test_anonymous_keys_are_scoped_by_client_address(app, client):
+    def register(username, address):
+        return client.post('/api/register', headers={'Idempotency-Key': 'same', 'X-Forwarded-For': address},
+                           json={'username': username, 'email': f'{username}@example.com', 'password': 'pw'})
+
+    assert register('alice', '203.0.113.1').status_code == 201
+    assert register('bob', '203.0.113.2').status_code == 201
+    assert register('carol', '203.0.113.1').status_code == 422
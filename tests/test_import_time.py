@@ -0,0 +1,15 @@
+# tests/test_import_time.py
+# Enforces the import-time budgets from benchmarks/import_time.py.
+
+import pytest
+
+from benchmarks.import_time import DEFAULT_BUDGETS, measure
+
+
+@pytest.mark.parametrize('module', sorted(DEFAULT_BUDGETS))
+def test_import_time_within_budget(module):
+    measure(module)  # warm the bytecode cache
+    best_ms = min(measure(module)[1] for _ in range(3))
+    assert best_ms <= DEFAULT_BUDGETS[module], (
+        f"importing {module} took {best_ms:.1f} ms, budget is {DEFAULT_BUDGETS[module]} ms"
+    )
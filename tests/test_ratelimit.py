@@ -0,0 +1,63 @@
+# tests/test_ratelimit.py
+
+from backend.ratelimit import MemoryStore, parse_rate
+
+
+def test_parse_rate():
+    assert parse_rate('10/minute') == (10, 10 / 60)
+    assert parse_rate('5/hours') == (5, 5 / 3600)
+
+
+def test_memory_store_refills_over_time():
+    store = MemoryStore()
+    assert store.consume('k', 2, 1.0, now=0.0) == (True, 0.0)
+    assert store.consume('k', 2, 1.0, now=0.0)[0] is True
+    allowed, retry_after = store.consume('k', 2, 1.0, now=0.0)
+    assert not allowed and retry_after == 1.0
+    assert store.consume('k', 2, 1.0, now=1.0)[0] is True
+
+
+def test_login_throttled_per_username_with_retry_after(app, client):
+    app.config['RATELIMIT_LOGIN_PER_USERNAME'] = '2/minute'
+    body = {'username': 'alice', 'password': 'wrong'}
+    assert client.post('/api/login', json=body).status_code == 401
+    assert client.post('/api/login', json=body).status_code == 401
+    response = client.post('/api/login', json={'username': 'ALICE', 'password': 'x'})
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) >= 1
+
+
+def test_register_limit_is_per_forwarded_client_ip(app, client):
+    app.config['RATELIMIT_REGISTER_PER_IP'] = '1/hour'
+
+    def register(name, ip):
+        return client.post('/api/register', json={'username': name, 'email': f'{name}@x.com', 'password': 'p'},
+                           headers={'X-Forwarded-For': ip})
+
+    assert register('a1', '203.0.113.1').status_code == 201
+    assert register('a2', '203.0.113.1').status_code == 429
+    # A different client behind the same proxy has its own bucket
+    assert register('b1', '203.0.113.2').status_code == 201
+
+
+def test_other_routes_traffic_does_not_refill_an_exhausted_bucket():
+    store = MemoryStore(stripes=1, max_keys=10)
+    register = ('register:203.0.113.1', 5, 5 / 3600)
+    for _ in range(5):
+        assert store.consume(*register, now=0.0)[0]
+
+    # Fast-refilling login buckets for many usernames overflow the stripe;
+    # only buckets that have refilled at their own rate may be dropped.
+    for n in range(50):
+        store.consume(f'login:user{n}', 20, 20 / 60, now=61.0 + n * 5)
+    allowed, retry_after = store.consume(*register, now=400.0)
+    assert not allowed and retry_after > 300
+
+
+def test_memory_store_stays_bounded_with_busy_keys():
+    store = MemoryStore(stripes=1, max_keys=100)
+    for n in range(1000):
+        store.consume(f'login:user{n}', 20, 20 / 60, now=0.0)
+        assert len(store._buckets[0]) <= 100
+    # The most recent keys are kept
+    assert 'login:user999' in store._buckets[0]
@@ -0,0 +1,62 @@
+# tests/test_request_cache.py
+
+import pytest
+
+from backend.app import create_app
+from backend.extensions import request_cache
+from backend.request_cache import MemoryListStore
+
+
+def test_memory_store_rejects_write_after_invalidation():
+    store = MemoryListStore(max_users=10, ttl=60)
+    generation = store.generation(1)
+    store.invalidate([1])
+    store.set(1, 'sent', ['stale'], generation)
+    assert store.get(1, 'sent') is None
+    store.set(1, 'sent', ['fresh'], store.generation(1))
+    assert store.get(1, 'sent') == ['fresh']
+
+
+def test_memory_store_evicts_least_recent_user():
+    store = MemoryListStore(max_users=2, ttl=60)
+    for user_id in (1, 2, 3):
+        store.set(user_id, 'sent', [user_id], 0)
+    assert store.get(1, 'sent') is None
+    assert store.get(3, 'sent') == [3]
+
+
+def test_memory_cache_is_off_by_default(app):
+    assert app.config['REQUEST_CACHE_ENABLED'] is False
+    assert request_cache.enabled is False
+
+
+def test_memory_cache_refused_with_several_workers(tmp_path, monkeypatch):
+    monkeypatch.setenv('WEB_CONCURRENCY', '2')
+    create_app(test_config={'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'x.db'}",
+                            'REQUEST_CACHE_ENABLED': True})
+    assert request_cache.enabled is False
+
+
+@pytest.fixture
+def cached_app(tmp_path, monkeypatch, app):
+    monkeypatch.setenv('WEB_CONCURRENCY', '1')
+    app.config['REQUEST_CACHE_ENABLED'] = True
+    request_cache.init_app(app)
+    return app
+
+
+def test_status_update_invalidates_both_users(cached_app, client, make_user, make_item, make_request,
+                                              auth_headers):
+    owner, requester = make_user('owner'), make_user('requester')
+    request_id = make_request(make_item(owner), requester)
+    owner_headers, requester_headers = auth_headers(owner), auth_headers(requester)
+
+    assert client.get('/api/requests/sent', headers=requester_headers).json[0]['status'] == 'pending'
+    assert client.get('/api/requests/sent', headers=requester_headers).json[0]['status'] == 'pending'
+    assert request_cache.stats()['sent']['hits'] >= 1
+
+    response = client.put(f'/api/requests/{request_id}/status', json={'status': 'accepted'},
+                          headers=owner_headers)
+    assert response.status_code == 200
+    assert client.get('/api/requests/sent', headers=requester_headers).json[0]['status'] == 'accepted'
+    assert client.get('/api/requests/received', headers=owner_headers).json[0]['status'] == 'accepted'
@@ -0,0 +1,50 @@
+# tests/test_stats.py
+
+from datetime import datetime, timedelta
+
+from backend.extensions import db
+from backend.models import DailyStat
+from backend.stats import NEW_ITEMS, record_stat, record_status_change
+
+
+def test_record_stat_accumulates_in_one_row(app):
+    with app.app_context():
+        record_stat(NEW_ITEMS, 'Home')
+        record_stat(NEW_ITEMS, 'Home', count=2)
+        record_status_change('accepted', [datetime(2024, 1, 1, 12, 0), datetime(2024, 1, 1, 11, 0)],
+                             now=datetime(2024, 1, 1, 13, 0))
+        db.session.commit()
+        rows = {(row.metric, row.key): (row.count, row.total) for row in DailyStat.query.all()}
+    assert rows[(NEW_ITEMS, 'Home')] == (3, 0.0)
+    assert rows[('requests_by_status', 'accepted')] == (2, 0.0)
+    assert rows[('acceptance_latency', '')] == (2, 3 * 3600.0)
+
+
+def test_admin_stats_reflect_write_paths(client, make_user, make_item, make_request, auth_headers):
+    admin = make_user('admin', role='admin')
+    client.post('/api/register', json={'username': 'newbie', 'email': 'newbie@example.com', 'password': 'pw'})
+    client.post('/api/items', headers=auth_headers(admin),
+                json={'title': 'Lamp', 'description': 'A lamp', 'category': 'Home'})
+    request_id = make_request(make_item(admin), make_user('requester'),
+                              requested_at=datetime.utcnow() - timedelta(hours=2))
+    client.put(f'/api/requests/{request_id}/status', json={'status': 'accepted'}, headers=auth_headers(admin))
+
+    body = client.get('/api/admin/stats', headers=auth_headers(admin, role='admin')).json
+    today = datetime.utcnow().date()
+    assert body['to'] == today.isoformat()
+    assert body['from'] == (today - timedelta(days=29)).isoformat()
+    totals = body['totals']
+    assert totals['new_users'] == 1
+    assert totals['new_items'] == {'Home': 1}
+    assert totals['requests_by_status'] == {'accepted': 1}
+    assert 7100 < totals['avg_acceptance_latency_seconds'] < 7300
+    assert [day['date'] for day in body['days']] == [today.isoformat()]
+
+
+def test_admin_stats_validates_range(app, client, make_user, auth_headers):
+    headers = auth_headers(make_user('admin', role='admin'), role='admin')
+    assert client.get('/api/admin/stats?from=2024-02-01&to=2024-01-01', headers=headers).status_code == 400
+    assert client.get('/api/admin/stats?from=yesterday', headers=headers).status_code == 400
+    app.config['STATS_MAX_DAYS'] = 7
+    assert client.get('/api/admin/stats?from=2024-01-01&to=2024-01-08', headers=headers).status_code == 400
+    assert client.get('/api/admin/stats?from=2024-01-01&to=2024-01-07', headers=headers).status_code == 200